@@ -14,6 +14,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'python-agent'))
 
 from runtime_monitor import init_monitor, monitor_function
 
+# FAST=1 skips the simulated waits so the monitor's own overhead dominates
+_SLEEP = (lambda seconds: None) if os.environ.get('FAST') else time.sleep
+
 # Initialize the monitor
 monitor = init_monitor("Fake Loop Demo")
 
@@ -21,7 +24,7 @@ monitor = init_monitor("Fake Loop Demo")
 def check_system_status():
     """Check system status - Condition 1"""
     print("🔍 Checking system status...")
-    time.sleep(2)  # Decent wait
+    _SLEEP(2)  # Decent wait
     
     # Random system status
     cpu_usage = random.uniform(20, 80)
@@ -42,7 +45,7 @@ def check_system_status():
 def validate_user_permissions(status):
     """Validate user permissions - Condition 2"""
     print("👤 Validating user permissions...")
-    time.sleep(1.5)  # Decent wait
+    _SLEEP(1.5)  # Decent wait
     
     # Simulate permission check
     has_admin = random.choice([True, False])
@@ -63,7 +66,7 @@ def validate_user_permissions(status):
 def check_network_connectivity(permissions):
     """Check network connectivity - Condition 3"""
     print("🌐 Checking network connectivity...")
-    time.sleep(2.5)  # Decent wait
+    _SLEEP(2.5)  # Decent wait
     
     # Simulate network checks
     internet_available = random.choice([True, True, False])  # Usually true
@@ -84,7 +87,7 @@ def check_network_connectivity(permissions):
 def verify_security_settings(network):
     """Verify security settings - Condition 4"""
     print("🔒 Verifying security settings...")
-    time.sleep(1.8)  # Decent wait
+    _SLEEP(1.8)  # Decent wait
     
     # Simulate security checks
     firewall_enabled = random.choice([True, True, False])  # Usually true
@@ -105,7 +108,7 @@ def verify_security_settings(network):
 def process_data_pipeline(security):
     """Process data pipeline - Condition 5"""
     print("⚙️ Processing data pipeline...")
-    time.sleep(3)  # Longer wait for processing
+    _SLEEP(3)  # Longer wait for processing
     
     # Simulate data processing
     data_size = random.uniform(100, 1000)
@@ -126,7 +129,7 @@ def process_data_pipeline(security):
 def generate_final_report(pipeline):
     """Generate final report"""
     print("📊 Generating final report...")
-    time.sleep(1)  # Short wait
+    _SLEEP(1)  # Short wait
     
     report = {
         'timestamp': time.time(),
@@ -188,7 +191,7 @@ def run_fake_loop():
             # Wait between loops
             if loop_count < max_loops:
                 print("⏳ Waiting 5 seconds before next loop...")
-                time.sleep(5)
+                _SLEEP(5)
         
         print(f"\n🎉 Fake loop demo completed! Ran {loop_count} loops.")
         
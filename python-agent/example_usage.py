@@ -1,4 +1,3 @@
-from typing import Any, Callable, Optional, Dict, List
 """
 Example usage of the Runtime Monitor Python Agent
 Demonstrates how to monitor your Python applications
@@ -6,22 +5,23 @@ Demonstrates how to monitor your Python applications
 
 import time
 import asyncio
-from runtime_monitor import init_monitor, monitor_function
+from typing import Any, Optional
+from runtime_monitor import init_monitor
 
 # Initialize the monitor
 monitor = init_monitor("Example Python App")
 
 # Example 1: Simple function monitoring
 @monitor.monitor_function()
-def calculate_fibonacci(n) -> None:
+def calculate_fibonacci(n):
     """Calculate the nth Fibonacci number"""
     if n <= 1:
-        return None  # {m.group(1)}
-    return None  # {m.group(1)}alculate_fibonacci(n-1) + calculate_fibonacci(n-2)
+        return n
+    return calculate_fibonacci(n-1) + calculate_fibonacci(n-2)
 
 # Example 2: Function with parameters
 @monitor.monitor_function()
-def process_user_data(user_id, data, options: Optional[Any] = None) -> None:
+def process_user_data(user_id, data, options: Optional[Any] = None):
     """Process user data with various parameters"""
     time.sleep(0.1)  # Simulate database work
     
@@ -32,11 +32,11 @@ def process_user_data(user_id, data, options: Optional[Any] = None) -> None:
         'timestamp': time.time()
     }
     
-    return None  # {m.group(1)}rocessed_data
+    return processed_data
 
 # Example 3: Async function monitoring
 @monitor.monitor_function()
-async def fetch_api_data(endpoint, params: Optional[Any] = None) -> None:
+async def fetch_api_data(endpoint, params: Optional[Any] = None):
     """Simulate API call"""
     await asyncio.sleep(0.2)  # Simulate network delay
     
@@ -49,14 +49,14 @@ async def fetch_api_data(endpoint, params: Optional[Any] = None) -> None:
 
 # Example 4: Error handling
 @monitor.monitor_function()
-def risky_operation(divisor) -> None:
+def risky_operation(divisor):
     """Function that might fail"""
     if divisor == 0:
         raise ValueError("Cannot divide by zero")
-    return None  # {m.group(1)}00 / divisor
+    return 100 / divisor
 
 # Example 5: Manual tracking (for complex scenarios)
-def complex_business_logic() -> None:
+def complex_business_logic():
     """Example of manual tracking for complex operations"""
     start_time = time.time()
     
@@ -184,6 +184,13 @@ async def main() -> None:
     print("Press Ctrl+C to exit...")
 
 if __name__ == "__main__":
+    # Use the io_uring event loop when it is installed; the agent itself does not need it
+    try:
+        import uringcore
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Run the example
     asyncio.run(main())
     
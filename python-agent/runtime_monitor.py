@@ -8,28 +8,458 @@ import sys
 import socketio
 import json
 import time
-import uuid
 import inspect
+import itertools
 import traceback
 import importlib
+import io
+import logging
 import os
+import queue
+import sched
+import types
 from functools import wraps
-from typing import Any, Dict, Callable, Optional
+from typing import Any, Dict, Callable, Iterable, Optional, Union
 import threading
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
 
+from serialization import SERIALIZE_BUDGET, serialize_parameters, serialize_value
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on events waiting to be emitted; further events are dropped
+EVENT_QUEUE_SIZE = 10000
+# A warning is logged each time this many more events have been dropped
+DROPPED_EVENTS_LOG_INTERVAL = 1000
+# Default maximum number of queued events shipped in a single batch emit
+EVENT_BATCH_SIZE = 100
+# Default seconds a partial batch may wait for more events before it is emitted
+EVENT_FLUSH_INTERVAL = 1.0
+# Maximum number of frames formatted into a stack trace, counted from where the error was raised
+STACK_TRACE_LIMIT = 20
+# Length of the call-rate window used to detect hot functions
+HOT_WINDOW_NS = 1_000_000_000
+# Durations kept per window for the aggregate percentiles
+HOT_DURATION_SAMPLES = 1024
+
+
+# Queue marker asking the event worker to emit its partial batch
+_FLUSH_EVENTS = object()
+# Queue marker asking the event worker to emit its partial batch and exit
+_STOP_EVENTS = object()
+# Queue marker telling the event worker a function turned hot, so windows must be rolled over on a timer
+_ROLL_HOT_WINDOWS = object()
+
+
+class _CallStats:
+    """Call-rate window for one monitored function"""
+    __slots__ = ('count', 'errors', 'window_start', 'hot', 'durations')
+    
+    def __init__(self, now_ns: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.window_start = now_ns
+        self.hot = False
+        self.durations: list = []
+
+
+class ExecutionEvent:
+    """Execution event for one monitored call, turned into a dict by the emitter thread"""
+    __slots__ = ('type', 'call_id', 'function_name', 'timestamp', 'parameters', 'end_timestamp',
+                 'duration', 'success', 'return_value', 'error', 'exc_info')
+    
+    def __init__(self, type: str, call_id: str, function_name: str, timestamp: float,
+                 parameters: Optional[dict] = None) -> None:
+        self.type = type
+        self.call_id = call_id
+        self.function_name = function_name
+        self.timestamp = timestamp
+        self.parameters = parameters
+        self.end_timestamp: Optional[float] = None
+        self.duration: Optional[float] = None
+        # None until the call has finished
+        self.success: Optional[bool] = None
+        self.return_value: Any = None
+        self.error: Optional[str] = None
+        # sys.exc_info() of a failed call, formatted into stackTrace by to_dict()
+        self.exc_info: Optional[tuple] = None
+        
+    def to_dict(self) -> dict:
+        """Build the execution_data payload sent to the hub"""
+        event_data = {
+            'type': self.type,
+            'callId': self.call_id,
+            'functionName': self.function_name,
+            'timestamp': self.timestamp
+        }
+        if self.parameters is not None:
+            event_data['parameters'] = self.parameters
+        if self.end_timestamp is not None:
+            event_data['endTimestamp'] = self.end_timestamp
+        if self.duration is not None:
+            event_data['duration'] = self.duration
+        if self.success is not None:
+            event_data['success'] = self.success
+            if self.success:
+                event_data['returnValue'] = self.return_value
+            else:
+                event_data['error'] = self.error
+                if self.exc_info is not None:
+                    event_data['stackTrace'] = ''.join(
+                        traceback.format_exception(*self.exc_info, limit=-STACK_TRACE_LIMIT))
+        return event_data
+        
+    def __repr__(self) -> str:
+        return f"ExecutionEvent({self.to_dict()!r})"
+
+
+class _OrjsonModule:
+    """json-module shim that lets socketio encode packets with orjson"""
+    
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        # socketio passes stdlib options such as separators; orjson output is already compact.
+        # Like the stdlib encoder, accept int keys (serialized user dicts keep theirs), encode
+        # any numpy value natively and fall back to str() where it would raise
+        try:
+            return orjson.dumps(obj, default=str,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            # orjson rejects ints beyond 64 bits without trying default; the stdlib encoder
+            # takes them, so one such value doesn't cost the whole batch
+            return json.dumps(obj, default=str, **kwargs)
+        
+    @staticmethod
+    def loads(data: Any, **kwargs) -> Any:
+        return orjson.loads(data)
+
+
+# PEP 669 (Python 3.12+) lets plain functions be observed without a wrapper frame
+_sys_monitoring = getattr(sys, 'monitoring', None)
+# Code that suspends (generators, coroutines) keeps using the wrapper decorators
+_CO_SUSPENDS = inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR | inspect.CO_ITERABLE_COROUTINE
+
+
+class _SysMonitoringBackend:
+    """Reports calls of registered code objects from sys.monitoring callbacks"""
+    
+    def __init__(self, tool_id: int) -> None:
+        self.tool_id = tool_id
+        self.codes: Dict[Any, tuple] = {}
+        self._local = threading.local()
+        events = _sys_monitoring.events
+        _sys_monitoring.register_callback(tool_id, events.PY_START, self._on_start)
+        _sys_monitoring.register_callback(tool_id, events.PY_RETURN, self._on_return)
+        _sys_monitoring.register_callback(tool_id, events.PY_UNWIND, self._on_unwind)
+        
+    def add(self, code: Any, agent: 'RuntimeMonitorAgent', name: str) -> None:
+        """Start reporting calls of a code object to an agent"""
+        # Reported in the wrappers' shape: positional parameters by name, extra positionals
+        # as arg_<i>, then keyword-only parameters and **kwargs entries by name
+        varnames = code.co_varnames
+        positional_names = varnames[:code.co_argcount]
+        index = code.co_argcount + code.co_kwonlyargcount
+        keyword_names = varnames[code.co_argcount:index]
+        varargs_name = None
+        if code.co_flags & inspect.CO_VARARGS:
+            varargs_name = varnames[index]
+            index += 1
+        varkw_name = varnames[index] if code.co_flags & inspect.CO_VARKEYWORDS else None
+        self.codes[code] = (agent, name, positional_names, varargs_name, keyword_names, varkw_name)
+        if agent._enabled:
+            self._set_code_events(code, True)
+            _sys_monitoring.set_events(self.tool_id, _sys_monitoring.events.PY_UNWIND)
+            
+    def discard(self, code: Any, agent: 'RuntimeMonitorAgent') -> None:
+        """Stop reporting calls of a code object registered by an agent"""
+        entry = self.codes.get(code)
+        if entry is None or entry[0] is not agent:
+            return
+        del self.codes[code]
+        self._set_code_events(code, False)
+        self._update_unwind_events()
+        
+    def set_agent_active(self, agent: 'RuntimeMonitorAgent', active: bool) -> None:
+        """Turn the events of an agent's code objects on while it is online and off while it is not"""
+        # Offline, monitored functions then run without any callback at all
+        for code, entry in list(self.codes.items()):
+            if entry[0] is agent:
+                self._set_code_events(code, active)
+        self._update_unwind_events()
+        
+    def _set_code_events(self, code: Any, active: bool) -> None:
+        events = _sys_monitoring.events
+        _sys_monitoring.set_local_events(self.tool_id, code, events.PY_START | events.PY_RETURN if active else 0)
+        
+    def _update_unwind_events(self) -> None:
+        # PY_UNWIND cannot be enabled per code object, so it fires for every unwinding
+        # frame in the process; keep it on only while some agent is online
+        active = any(entry[0]._enabled for entry in list(self.codes.values()))
+        _sys_monitoring.set_events(self.tool_id, _sys_monitoring.events.PY_UNWIND if active else 0)
+            
+    def _calls(self) -> list:
+        try:
+            return self._local.calls
+        except AttributeError:
+            calls = self._local.calls = []
+            return calls
+            
+    def _on_start(self, code: Any, offset: int) -> Any:
+        entry = self.codes.get(code)
+        if entry is None:
+            return _sys_monitoring.DISABLE
+        agent, name, positional_names, varargs_name, keyword_names, varkw_name = entry
+        calls = self._calls()
+        if not agent._enabled or agent._thread_state.internal:
+            calls.append((code, agent, name, None, None, 0))
+            return None
+            
+        stats = agent._call_stats.get(name)
+        if stats is None:
+            stats = agent._call_stats.setdefault(name, _CallStats(time.perf_counter_ns()))
+        if stats.hot and stats.count % agent.hot_sample_rate:
+            # Hot function outside the sample: only feed the window aggregate
+            calls.append((code, agent, name, stats, None, time.perf_counter_ns()))
+            return None
+            
+        event = ExecutionEvent('call', agent._id_prefix + format(next(agent._id_counter), 'x'),
+                               name, time.time() * 1000)
+        thread_state = agent._thread_state
+        
+        # At PY_START the frame's locals hold exactly the bound arguments
+        frame_locals = sys._getframe(1).f_locals
+        # Shared by all of the call's parameters
+        budget = [SERIALIZE_BUDGET]
+        cache: Dict[int, tuple] = {}
+        thread_state.internal = True
+        try:
+            params = {param: serialize_value(frame_locals[param], cache, budget) for param in positional_names}
+            if varargs_name is not None:
+                for i, value in enumerate(frame_locals[varargs_name], len(positional_names)):
+                    params[f"arg_{i}"] = serialize_value(value, cache, budget)
+            for param in keyword_names:
+                params[param] = serialize_value(frame_locals[param], cache, budget)
+            if varkw_name is not None:
+                for key, value in frame_locals[varkw_name].items():
+                    params[key] = serialize_value(value, cache, budget)
+        finally:
+            thread_state.internal = False
+        event.parameters = params
+        
+        calls.append((code, agent, name, stats, event, time.perf_counter_ns()))
+        return None
+        
+    def _on_return(self, code: Any, offset: int, retval: Any) -> None:
+        self._finish(code, retval, None)
+        
+    def _on_unwind(self, code: Any, offset: int, exception: BaseException) -> None:
+        if code in self.codes:
+            self._finish(code, None, exception)
+            
+    def _finish(self, code: Any, retval: Any, exception: Optional[BaseException]) -> None:
+        end_ns = time.perf_counter_ns()
+        calls = self._calls()
+        if calls and calls[-1][0] is code:
+            entry = calls.pop()
+        else:
+            # Calls above this one whose exit was never seen, because their events were
+            # turned off while they ran, are dropped along with it
+            for index in range(len(calls) - 2, -1, -1):
+                if calls[index][0] is code:
+                    break
+            else:
+                return  # Monitoring started while this call was already running
+            entry = calls[index]
+            del calls[index:]
+        _, agent, name, stats, event, start_ns = entry
+        if stats is None:
+            return
+            
+        if event is not None:
+            duration = (end_ns - start_ns) / 1_000_000
+            event.end_timestamp = event.timestamp + duration
+            event.duration = duration
+            if exception is None:
+                event.success = True
+                event.return_value = agent._serialize_value(retval)
+            else:
+                event.success = False
+                event.error = str(exception)
+                event.exc_info = (type(exception), exception, exception.__traceback__)
+            agent._send_execution_event(event)
+        elif exception is not None:
+            agent._send_unsampled_failure(name, end_ns - start_ns,
+                                          (type(exception), exception, exception.__traceback__))
+            
+        agent._record_call(name, stats, end_ns, end_ns - start_ns, exception is not None)
+
+
+# Shared by all agents: sys.monitoring tool ids are process-wide (False once unavailable)
+_sys_monitoring_backend: Any = None
+# Tool ids not reserved for debuggers (0), coverage (1), profilers (2) or optimizers (5),
+# so cProfile and friends keep working alongside the agent
+_SYS_MONITORING_TOOL_IDS = (3, 4)
+
+
+def _get_sys_monitoring_backend() -> Optional[_SysMonitoringBackend]:
+    """Claim a free tool id on first use, or None when sys.monitoring can't be used"""
+    global _sys_monitoring_backend
+    if _sys_monitoring_backend is None:
+        _sys_monitoring_backend = False
+        if _sys_monitoring is not None:
+            for tool_id in _SYS_MONITORING_TOOL_IDS:
+                try:
+                    _sys_monitoring.use_tool_id(tool_id, 'runtime-monitor')
+                except ValueError:
+                    continue  # Another tool owns this id
+                _sys_monitoring_backend = _SysMonitoringBackend(tool_id)
+                break
+    return _sys_monitoring_backend or None
+
+
+def _has_own_code(func: Callable) -> bool:
+    """Whether func's code object belongs to it alone"""
+    # sys.monitoring reports calls per code object, and every function a factory or an
+    # enclosing function creates shares the code of its def
+    return func.__closure__ is None and '<locals>' not in func.__qualname__
+
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _positional_parameter_names(func: Callable) -> tuple:
+    """Names that positional arguments bind to, in order"""
+    if type(func) is types.FunctionType and not hasattr(func, '__wrapped__') and not hasattr(func, '__signature__'):
+        # A plain function's signature is its code object; no need to build an inspect.Signature
+        return func.__code__.co_varnames[:func.__code__.co_argcount]
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return ()  # No signature (some builtins); arguments are reported as arg_<i>
+    # Extra positionals collected by *args and keyword-only names never line up with args
+    return tuple(param.name for param in parameters if param.kind in _POSITIONAL_KINDS)
+
+
+def _parameter_defaults(func: Callable) -> tuple:
+    """(name, default) for every parameter with a default, reported when a call leaves it out"""
+    if type(func) is types.FunctionType and not hasattr(func, '__wrapped__') and not hasattr(func, '__signature__'):
+        code = func.__code__
+        defaults = func.__defaults__ or ()
+        names = code.co_varnames[code.co_argcount - len(defaults):code.co_argcount]
+        return tuple(zip(names, defaults)) + tuple((func.__kwdefaults__ or {}).items())
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+    return tuple((param.name, param.default) for param in parameters if param.default is not param.empty)
+
+
+# Names bound by generated wrapper factories; functions using any of them as a parameter
+# keep the generic wrapper
+_WRAPPER_CLOSURE_NAMES = frozenset(('_monitor_agent', '_monitor_func', '_monitor_name', '_monitor_params'))
+# Parameter names -> factory compiled for that exact signature
+_wrapper_factories: Dict[tuple, Callable] = {}
+
+
+def _make_positional_wrapper(agent: 'RuntimeMonitorAgent', func: Callable, name: str,
+                             param_names: tuple) -> Optional[Callable]:
+    """Build a wrapper with the function's own parameter list, or None if it has no plain signature"""
+    code = getattr(func, '__code__', None)
+    if (code is None or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+            or code.co_posonlyargcount or code.co_kwonlyargcount
+            or param_names != code.co_varnames[:code.co_argcount]
+            or _WRAPPER_CLOSURE_NAMES.intersection(param_names)):
+        return None
+        
+    factory = _wrapper_factories.get(param_names)
+    if factory is None:
+        # Named parameters spare the *args tuple and **kwargs dict the generic wrapper builds per call
+        params = ', '.join(param_names)
+        source = (
+            "def factory(_monitor_agent, _monitor_func, _monitor_name, _monitor_params):\n"
+            f"    def wrapper({params}):\n"
+            "        if not _monitor_agent._enabled:\n"
+            f"            return _monitor_func({params})\n"
+            "        return _monitor_agent._execute_function(\n"
+            f"            _monitor_name, _monitor_func, ({params}{',' if len(param_names) == 1 else ''}), {{}}, _monitor_params)\n"
+            "    return wrapper\n"
+        )
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, f"<runtime monitor wrapper ({params})>", 'exec'), namespace)
+        factory = _wrapper_factories.setdefault(param_names, namespace['factory'])
+        
+    wrapper = wraps(func)(factory(agent, func, name, param_names))
+    # Same parameter names in the same order, so the defaults line up too
+    wrapper.__defaults__ = func.__defaults__
+    return wrapper
+
+
+class _ThreadState(threading.local):
+    """Per-thread agent state"""
+    
+    def __init__(self) -> None:
+        # True while the agent itself runs user code on this thread, e.g. a __repr__ while
+        # serializing; monitored functions called then are not reported
+        self.internal = False
+
 
 class RuntimeMonitorAgent:
     """Python agent for monitoring function execution and reporting to Runtime Hub"""
     
-    def __init__(self, app_name: str, hub_url: str = "http://localhost:3000") -> None:
+    def __init__(self, app_name: str, hub_url: str = "http://localhost:3000",
+                 split_async_events: bool = True, hot_threshold: int = 1000,
+                 hot_sample_rate: int = 100, use_sys_monitoring: bool = True,
+                 batch_size: int = EVENT_BATCH_SIZE,
+                 flush_interval: float = EVENT_FLUSH_INTERVAL) -> None:
+        if hot_sample_rate < 1:
+            raise ValueError(f"hot_sample_rate must be at least 1, got {hot_sample_rate}")
         self.app_name = app_name
         self.hub_url = hub_url
-        self.sio = socketio.Client()
+        # Functions called more than hot_threshold times per second only send
+        # 1 in hot_sample_rate call events plus a per-second aggregate
+        # (hot_threshold=0 turns sampling off; hot_sample_rate=1 sends every call)
+        self.hot_threshold = hot_threshold
+        self.hot_sample_rate = hot_sample_rate
+        self._call_stats: Dict[str, _CallStats] = {}
+        self._stats_lock = threading.Lock()
+        self._thread_state = _ThreadState()
+        # (module, attribute, original, registered) for every function patched by instrument_module(),
+        # registered telling whether it added the original's code object to sys.monitoring
+        self._patched: list = []
+        # Worker threads for workflow code nodes, created on first use
+        self._exec_pool: Optional[ThreadPoolExecutor] = None
+        # Function monitors started from workflow nodes all tick on one scheduler thread
+        self._monitors: Dict[str, dict] = {}
+        self._monitor_scheduler = sched.scheduler(time.monotonic, time.sleep)
+        self._monitor_wakeup = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+        # Emit call_enter/call_exit pairs for async calls instead of one call event
+        self.split_async_events = split_async_events
+        # Observe plain functions through sys.monitoring (Python 3.12+) instead of wrapping them
+        self.use_sys_monitoring = use_sys_monitoring
+        self.sio = socketio.Client(json=_OrjsonModule if orjson is not None else None)
         self.app_id: Optional[Any] = None
         self.connected = False
-        self.call_stack = []
+        # True only while connected and registered; checked first by every wrapper
+        self._enabled = False
+        # Call ids are a counter behind a random per-agent prefix: one urandom read instead of a
+        # uuid4 per call, and unlike pid/start time the prefix cannot repeat across containers
+        self._id_prefix = os.urandom(8).hex() + '-'
+        self._id_counter = itertools.count()
+        # Events discarded because the queue was full or the agent was not registered
+        self.dropped_events = 0
+        # Queued events are emitted in batches of up to batch_size, at most flush_interval seconds late
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._event_q: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        # Started on connect and stopped by disconnect_from_hub(); events are only queued in between
+        self._event_worker: Optional[threading.Thread] = None
         self.setup_socket_handlers()
         
     def setup_socket_handlers(self) -> None:
@@ -38,6 +468,7 @@ class RuntimeMonitorAgent:
         @self.sio.event
         def connect() -> None:
             print(f"Connected to Runtime Hub: {self.hub_url}")
+            self._start_event_worker()
             self.connected = True
             # Register the application
             self.sio.emit('register_app', {'name': self.app_name})
@@ -46,10 +477,12 @@ class RuntimeMonitorAgent:
         def disconnect() -> None:
             print("Disconnected from Runtime Hub")
             self.connected = False
+            self._set_enabled(False)
             
         @self.sio.event
         def registered(data) -> None:
             self.app_id = data['appId']
+            self._set_enabled(self.connected)
             print(f"Application registered with ID: {self.app_id}")
             
         # Workflow execution handlers
@@ -68,286 +501,571 @@ class RuntimeMonitorAgent:
             """Import Python module"""
             self._handle_module_import(data)
             
+    def _set_enabled(self, enabled: bool) -> None:
+        """Turn monitoring on or off, including this agent's sys.monitoring events"""
+        self._enabled = enabled
+        if _sys_monitoring_backend:
+            _sys_monitoring_backend.set_agent_active(self, enabled)
+            
     def connect_to_hub(self) -> bool:
         """Connect to the Runtime Hub"""
         try:
-            self.sio.connect(self.hub_url)
-            return None  # {m.group(1)}rue
+            # Go straight to WebSocket instead of long-polling first and upgrading
+            self.sio.connect(self.hub_url, transports=['websocket'])
+            return True
         except Exception as e:
             print(f"Failed to connect to Runtime Hub: {e}")
-            return None  # {m.group(1)}alse
+            return False
             
     def disconnect_from_hub(self) -> None:
         """Disconnect from the Runtime Hub"""
+        self.restore_instrumented()
+        if self._exec_pool is not None:
+            self._exec_pool.shutdown(wait=False)
+            self._exec_pool = None
+        if self.connected:
+            self.flush()
+        self._stop_event_worker()
         if self.connected:
             self.sio.disconnect()
             
-    def monitor_function(self, func_name: Optional[str] = None) -> None:
-        """Decorator to monitor function execution"""
-        def decorator(func: Callable) -> Callable:
-            name = func_name or f"{func.__module__}.{func.__name__}"
+    def flush(self) -> None:
+        """Block until every queued execution event has been emitted"""
+        if self._event_worker is None:
+            return  # Nothing is queued without a worker
+        # Hot functions' aggregates are pending until their windows end
+        self._roll_hot_windows(0)
+        self._event_q.put(_FLUSH_EVENTS)
+        self._event_q.join()
+        
+    def _start_event_worker(self) -> None:
+        """Start the background emitter unless it is already running"""
+        if self._event_worker is None:
+            self._event_worker = threading.Thread(target=self._event_loop, name='runtime-monitor-events',
+                                                  daemon=True)
+            self._event_worker.start()
+            if any(stats.hot for stats in list(self._call_stats.values())):
+                self._watch_hot_windows()
             
-            @wraps(func)
-            def wrapper(*args, **kwargs) -> None:
-                return None  # {m.group(1)}elf._execute_function(name, func, args, kwargs)
-                
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs) -> None:
-                return None  # {m.group(1)}wait self._execute_async_function(name, func, args, kwargs)
+    def _stop_event_worker(self) -> None:
+        """Have the background emitter send what is queued, then wait for it to exit"""
+        worker = self._event_worker
+        if worker is not None:
+            self._event_worker = None
+            self._event_q.put(_STOP_EVENTS)
+            worker.join()
+            
+    def monitor_function(self, func_name: Union[str, Callable, None] = None) -> Callable:
+        """Decorator to monitor function execution, usable as @monitor_function or @monitor_function(name)"""
+        def decorator(func: Callable) -> Callable:
+            # Applying the decorator again, e.g. through the module-level helper, must not wrap twice
+            if getattr(func, '__runtime_monitored__', False):
+                return func
                 
+            name = sys.intern(func_name or f"{func.__module__}.{func.__name__}")
+            # Resolve parameter names once instead of inspecting frames per call
+            param_names = _positional_parameter_names(func)
+            param_defaults = _parameter_defaults(func)
+            
+            code = getattr(func, '__code__', None)
+            if (self.use_sys_monitoring and code is not None and not code.co_flags & _CO_SUSPENDS
+                    and _has_own_code(func)):
+                backend = _get_sys_monitoring_backend()
+                if backend is not None:
+                    # No wrapper at all: calls are reported by the sys.monitoring callbacks
+                    backend.add(code, self, name)
+                    return func
+                    
             # Return appropriate wrapper based on function type
             if inspect.iscoroutinefunction(func):
-                return None  # {m.group(1)}sync_wrapper
-            else:
-                return None  # {m.group(1)}rapper
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self._enabled:
+                        return await func(*args, **kwargs)
+                    return await self._execute_async_function(name, func, args, kwargs, param_names,
+                                                              param_defaults)
+                    
+                async_wrapper.__runtime_monitored__ = True
+                return async_wrapper
+                
+            wrapper = _make_positional_wrapper(self, func, name, param_names)
+            if wrapper is None:
+                @wraps(func)
+                def wrapper(*args, **kwargs):
+                    if not self._enabled:
+                        return func(*args, **kwargs)
+                    return self._execute_function(name, func, args, kwargs, param_names, param_defaults)
+                    
+            wrapper.__runtime_monitored__ = True
+            return wrapper
                 
-        return None  # {m.group(1)}ecorator
+        if callable(func_name):
+            # Applied directly, without parentheses
+            func, func_name = func_name, None
+            return decorator(func)
+        return decorator
+        
+    def unmonitor_function(self, func: Callable) -> Callable:
+        """Stop monitoring a function decorated by this agent, returning the undecorated function"""
+        if getattr(func, '__runtime_monitored__', False):
+            return func.__wrapped__  # The wrapper itself keeps reporting wherever it is still referenced
+        code = getattr(func, '__code__', None)
+        if code is not None and _sys_monitoring_backend:
+            _sys_monitoring_backend.discard(code, self)
+        return func
+        
+    def instrument_module(self, module: Any, include: Optional[Iterable[str]] = None,
+                          exclude: Optional[Iterable[str]] = None) -> list:
+        """Replace a module's functions with monitored wrappers, returning the patched names"""
+        include = set(include) if include is not None else None
+        exclude = set(exclude or ())
+        patched = []
         
-    def _execute_function(self, name: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+        for attr, value in list(vars(module).items()):
+            if include is not None:
+                if attr not in include:
+                    continue
+            elif attr.startswith('_') or getattr(value, '__module__', None) != module.__name__:
+                # By default only public functions defined by the module itself
+                continue
+            if attr in exclude or not inspect.isfunction(value):
+                continue
+            code = value.__code__
+            if _sys_monitoring_backend and code in _sys_monitoring_backend.codes:
+                continue  # Already reported through sys.monitoring, e.g. decorated explicitly
+                
+            setattr(module, attr, self.monitor_function()(value))
+            registered = bool(_sys_monitoring_backend) and code in _sys_monitoring_backend.codes
+            self._patched.append((module, attr, value, registered))
+            patched.append(attr)
+            
+        return patched
+        
+    def restore_instrumented(self) -> None:
+        """Put back every function replaced by instrument_module()"""
+        while self._patched:
+            module, attr, original, registered = self._patched.pop()
+            setattr(module, attr, original)
+            if registered:
+                # Only code objects instrument_module() added; functions decorated explicitly keep reporting
+                _sys_monitoring_backend.discard(original.__code__, self)
+            
+    def _execute_function(self, name: str, func: Callable, args: tuple, kwargs: dict,
+                          param_names: tuple = (), param_defaults: tuple = ()) -> Any:
         """Execute and monitor a synchronous function"""
-        call_id = str(uuid.uuid4())
+        if self._thread_state.internal:
+            return func(*args, **kwargs)
+            
+        now = time.perf_counter_ns
+        record = self._record_call
+        stats = self._call_stats.get(name)
+        if stats is None:
+            stats = self._call_stats.setdefault(name, _CallStats(now()))
+            
+        if stats.hot and stats.count % self.hot_sample_rate:
+            # Hot function outside the sample: only feed the window aggregate
+            start_ns = now()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                end_ns = now()
+                self._send_unsampled_failure(name, end_ns - start_ns, sys.exc_info())
+                record(name, stats, end_ns, end_ns - start_ns, True)
+                raise
+            end_ns = now()
+            record(name, stats, end_ns, end_ns - start_ns, False)
+            return result
+                
+        send = self._send_execution_event
+        serialize = self._serialize_value
+        
+        # Wall clock only stamps the event; durations come from the monotonic counter
         start_time = time.time()
+        event = ExecutionEvent('call', self._id_prefix + format(next(self._id_counter), 'x'),
+                               name, start_time * 1000)
+        start_ns = now()
         
         # Prepare parameter data
-        params = self._serialize_parameters(args, kwargs)
-        
-        # Send function start event
-        self._send_execution_event({
-            'type': 'call_enter',
-            'callId': call_id,
-            'functionName': name,
-            'timestamp': start_time * 1000,
-            'parameters': params
-        })
+        event.parameters = self._serialize_parameters(args, kwargs, param_names, param_defaults)
         
         try:
             result = func(*args, **kwargs)
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
+            end_ns = now()
+            duration = (end_ns - start_ns) / 1_000_000
             
-            # Send function success event
-            self._send_execution_event({
-                'type': 'call_exit',
-                'callId': call_id,
-                'functionName': name,
-                'timestamp': end_time * 1000,
-                'duration': duration,
-                'success': True,
-                'returnValue': self._serialize_value(result)
-            })
+            # Send a single call record once the function has returned
+            event.end_timestamp = start_time * 1000 + duration
+            event.duration = duration
+            event.success = True
+            event.return_value = serialize(result)
+            send(event)
+            record(name, stats, end_ns, end_ns - start_ns, False)
             
-            return None  # {m.group(1)}esult
+            return result
             
         except Exception as e:
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
+            end_ns = now()
+            duration = (end_ns - start_ns) / 1_000_000
             
-            # Send function error event
-            self._send_execution_event({
-                'type': 'call_exit',
-                'callId': call_id,
-                'functionName': name,
-                'timestamp': end_time * 1000,
-                'duration': duration,
-                'success': False,
-                'error': str(e),
-                'stackTrace': traceback.format_exc()
-            })
+            # Send a single failed call record
+            event.end_timestamp = start_time * 1000 + duration
+            event.duration = duration
+            event.success = False
+            event.error = str(e)
+            event.exc_info = sys.exc_info()  # Formatted into stackTrace by the emitter thread
+            send(event)
+            record(name, stats, end_ns, end_ns - start_ns, True)
             
             raise
             
-    async def _execute_async_function(self, name: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+    def _record_call(self, name: str, stats: _CallStats, end_ns: int, elapsed_ns: int, failed: bool) -> None:
+        """Update the call-rate window of a function and roll it over every second"""
+        stats.count += 1
+        if failed:
+            stats.errors += 1
+        if len(stats.durations) < HOT_DURATION_SAMPLES:
+            stats.durations.append(elapsed_ns)
+        if self.hot_threshold and not stats.hot and stats.count > self.hot_threshold:
+            # Already past the threshold inside a single window
+            stats.hot = True
+            self._watch_hot_windows()
+            
+        if end_ns - stats.window_start >= HOT_WINDOW_NS:
+            self._roll_window(name, stats, end_ns, HOT_WINDOW_NS)
+            
+    def _roll_window(self, name: str, stats: _CallStats, now_ns: int, min_window_ns: int) -> None:
+        """Send a hot function's aggregate for its current window and start a new one"""
+        with self._stats_lock:
+            window_ns = now_ns - stats.window_start
+            if window_ns < min_window_ns or window_ns <= 0:
+                return  # Another thread rolled the window over
+                
+            count, errors, durations = stats.count, stats.errors, stats.durations
+            if stats.hot and durations:
+                durations.sort()
+                self._send_execution_event({
+                    'type': 'call_aggregate',
+                    'functionName': name,
+                    'timestamp': time.time() * 1000,
+                    'window': window_ns / 1_000_000,
+                    'count': count,
+                    'errors': errors,
+                    'sampleRate': self.hot_sample_rate,
+                    'duration': durations[len(durations) // 2] / 1_000_000,
+                    'p50': durations[len(durations) // 2] / 1_000_000,
+                    'p99': durations[int(len(durations) * 0.99)] / 1_000_000,
+                    'max': durations[-1] / 1_000_000
+                })
+                
+            was_hot = stats.hot
+            stats.hot = bool(self.hot_threshold) and count * HOT_WINDOW_NS > self.hot_threshold * window_ns
+            stats.count = 0
+            stats.errors = 0
+            stats.durations = []
+            stats.window_start = now_ns
+        if stats.hot and not was_hot:
+            self._watch_hot_windows()
+            
+    def _roll_hot_windows(self, min_window_ns: int) -> bool:
+        """Roll over every hot window open for at least min_window_ns, returning whether any function is still hot"""
+        now_ns = time.perf_counter_ns()
+        still_hot = False
+        for name, stats in list(self._call_stats.items()):
+            if stats.hot:
+                self._roll_window(name, stats, now_ns, min_window_ns)
+                still_hot = still_hot or stats.hot
+        return still_hot
+        
+    def _watch_hot_windows(self) -> None:
+        """Have the event worker roll over windows that calls stopped rolling over"""
+        if self._event_worker is not None:
+            try:
+                self._event_q.put_nowait(_ROLL_HOT_WINDOWS)
+            except queue.Full:
+                pass  # The worker is busy draining; the next function to turn hot asks again
+                
+    def _send_unsampled_failure(self, name: str, elapsed_ns: int, exc_info: tuple) -> None:
+        """Send a failed call of a hot function outside the sample, whose parameters were never captured"""
+        # Failures are never sampled away; only successful calls are left to the aggregate
+        end_time = time.time() * 1000
+        duration = elapsed_ns / 1_000_000
+        event = ExecutionEvent('call', self._id_prefix + format(next(self._id_counter), 'x'),
+                               name, end_time - duration)
+        event.end_timestamp = end_time
+        event.duration = duration
+        event.success = False
+        event.error = str(exc_info[1])
+        event.exc_info = exc_info
+        self._send_execution_event(event)
+        
+    async def _execute_async_function(self, name: str, func: Callable, args: tuple, kwargs: dict,
+                                      param_names: tuple = (), param_defaults: tuple = ()) -> Any:
         """Execute and monitor an asynchronous function"""
-        call_id = str(uuid.uuid4())
+        call_id = self._id_prefix + format(next(self._id_counter), 'x')
+        # Wall clock only stamps the event; durations come from the monotonic counter
         start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Prepare parameter data
-        params = self._serialize_parameters(args, kwargs)
+        params = self._serialize_parameters(args, kwargs, param_names, param_defaults)
         
-        # Send function start event
-        self._send_execution_event({
-            'type': 'call_enter',
-            'callId': call_id,
-            'functionName': name,
-            'timestamp': start_time * 1000,
-            'parameters': params
-        })
+        # Awaited calls interleave, so announce the start before suspending
+        if self.split_async_events:
+            self._send_execution_event(ExecutionEvent('call_enter', call_id, name, start_time * 1000, params))
         
         try:
             result = await func(*args, **kwargs)
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # Send function success event
-            self._send_execution_event({
-                'type': 'call_exit',
-                'callId': call_id,
-                'functionName': name,
-                'timestamp': end_time * 1000,
-                'duration': duration,
-                'success': True,
-                'returnValue': self._serialize_value(result)
-            })
-            
-            return None  # {m.group(1)}esult
+            event = ExecutionEvent('call_exit', call_id, name, start_time * 1000 + duration)
+            event.duration = duration
+            event.success = True
+            event.return_value = self._serialize_value(result)
             
         except Exception as e:
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # Send function error event
-            self._send_execution_event({
-                'type': 'call_exit',
-                'callId': call_id,
-                'functionName': name,
-                'timestamp': end_time * 1000,
-                'duration': duration,
-                'success': False,
-                'error': str(e),
-                'stackTrace': traceback.format_exc()
-            })
-            
+            event = ExecutionEvent('call_exit', call_id, name, start_time * 1000 + duration)
+            event.duration = duration
+            event.success = False
+            event.error = str(e)
+            event.exc_info = sys.exc_info()  # Formatted into stackTrace by the emitter thread
+            self._send_execution_event(self._async_exit_event(event, start_time, params))
             raise
             
+        self._send_execution_event(self._async_exit_event(event, start_time, params))
+        return result
+        
+    def _async_exit_event(self, event: ExecutionEvent, start_time: float, params: dict) -> ExecutionEvent:
+        """Fold the start of an async call into its exit event unless events are split"""
+        if not self.split_async_events:
+            event.type = 'call'
+            event.end_timestamp = event.timestamp
+            event.timestamp = start_time * 1000
+            event.parameters = params
+        return event
+            
     def track_manual_call(self, function_name: str, parameters: Optional[dict] = None, 
                          return_value: Optional[Any] = None, error: Optional[Exception] = None, 
                          start_time: Optional[float] = None, end_time: Optional[float] = None) -> None:
         """Manually track a function call (for custom monitoring)"""
-        if start_time is None:
-            start_time = time.time()
-        if end_time is None:
-            end_time = time.time()
+        if not self._enabled:
+            return  # Nothing would be sent, so skip serializing the return value
+            
+        # Missing bounds share one clock read, so an untimed call reports a zero duration
+        if start_time is None or end_time is None:
+            now = time.time()
+            if start_time is None:
+                start_time = now
+            if end_time is None:
+                end_time = now
             
         duration = (end_time - start_time) * 1000
-        call_id = str(uuid.uuid4())
-        
-        # Send function start event
-        self._send_execution_event({
-            'type': 'call_enter',
-            'callId': call_id,
-            'functionName': function_name,
-            'timestamp': start_time * 1000,
-            'parameters': parameters or {}
-        })
+        call_id = self._id_prefix + format(next(self._id_counter), 'x')
         
-        # Send function end event
-        event_data = {
-            'type': 'call_exit',
-            'callId': call_id,
-            'functionName': function_name,
-            'timestamp': end_time * 1000,
-            'duration': duration,
-            'success': error is None
-        }
+        # The call has already finished, so a single call record covers it
+        event = ExecutionEvent('call', call_id, function_name, start_time * 1000, parameters or {})
+        event.end_timestamp = end_time * 1000
+        event.duration = duration
+        event.success = error is None
         
         if return_value is not None:
-            event_data['returnValue'] = self._serialize_value(return_value)
+            event.return_value = self._serialize_value(return_value)
             
         if error is not None:
-            event_data['error'] = str(error)
-            event_data['stackTrace'] = traceback.format_exc()
+            event.error = str(error)
+            # Format the error's own traceback, not whatever exception is being handled
+            event.exc_info = (type(error), error, error.__traceback__)
             
-        self._send_execution_event(event_data)
+        self._send_execution_event(event)
         
     def define_workflow_nodes(self, nodes: list, connections: list) -> None:
         """Define the workflow structure for visualization"""
         if self.connected and self.app_id:
-            self.sio.emit('node_data', {
+            self._queue_emit('node_data', {
                 'nodes': nodes,
                 'connections': connections
             })
             
-    def _send_execution_event(self, event_data: dict) -> None:
-        """Send execution event to Runtime Hub"""
+    def _queue_emit(self, channel: str, payload: Any) -> None:
+        """Have the background emitter send a Socket.IO message, after the events queued before it"""
+        try:
+            self._event_q.put_nowait((channel, payload))
+        except queue.Full:
+            self._drop_event('queue full')
+            
+    def _send_execution_event(self, event_data: Any) -> None:
+        """Queue an ExecutionEvent or aggregate dict for the background emitter"""
         if self.connected and self.app_id:
-            self.sio.emit('execution_data', event_data)
+            try:
+                self._event_q.put_nowait(event_data)
+            except queue.Full:
+                self._drop_event('queue full')
         else:
-            # Buffer events if not connected (optional)
-            print(f"Buffered event (not connected): {event_data}")
+            # Not registered with the hub yet, or no longer; the event has nowhere to go
+            self._drop_event('not connected')
             
-    def _serialize_parameters(self, args: tuple, kwargs: dict) -> dict:
-        """Serialize function parameters for transmission"""
-        serialized = {}
-        
-        # Handle positional arguments
-        if args:
-            # Try to get parameter names from the calling frame
+    def _drop_event(self, reason: str) -> None:
+        """Count a discarded event, logging only every DROPPED_EVENTS_LOG_INTERVAL of them"""
+        self.dropped_events += 1
+        if self.dropped_events % DROPPED_EVENTS_LOG_INTERVAL == 0:
+            logger.warning("Dropped %d events so far (%s)", self.dropped_events, reason)
+            
+    def _event_loop(self) -> None:
+        """Emit queued messages, and execution events once a batch fills, ages out, holds an error or is flushed"""
+        event_q = self._event_q
+        batch: list = []
+        deadline = 0.0
+        # While some function is hot, when to roll over the windows of those that went quiet
+        roll_deadline: Optional[float] = None
+        # Anything this thread runs, such as str() fallbacks while encoding, is agent work
+        self._thread_state.internal = True
+        while True:
+            wake = deadline if batch else None
+            if roll_deadline is not None and (wake is None or roll_deadline < wake):
+                wake = roll_deadline
             try:
-                frame = inspect.currentframe().f_back.f_back
-                arg_info = inspect.getargvalues(frame)
+                if wake is not None:
+                    event_data = event_q.get(timeout=max(0.0, wake - time.monotonic()))
+                else:
+                    event_data = event_q.get()
+            except queue.Empty:
+                now = time.monotonic()
+                if roll_deadline is not None and now >= roll_deadline:
+                    still_hot = self._roll_hot_windows(HOT_WINDOW_NS)
+                    roll_deadline = now + HOT_WINDOW_NS / 1e9 if still_hot else None
+                if batch and now >= deadline:
+                    self._emit_batch(batch)
+                    batch = []
+                continue
                 
-                # Map positional args to parameter names
-                for i, arg in enumerate(args):
-                    if i < len(arg_info.args):
-                        param_name = arg_info.args[i]
-                    else:
-                        param_name = f"arg_{i}"
-                    serialized[param_name] = self._serialize_value(arg)
-            except:
-                # Fallback: use generic names
-                for i, arg in enumerate(args):
-                    serialized[f"arg_{i}"] = self._serialize_value(arg)
-                    
-        # Handle keyword arguments
-        for key, value in kwargs.items():
-            serialized[key] = self._serialize_value(value)
+            if event_data is _ROLL_HOT_WINDOWS:
+                if roll_deadline is None:
+                    roll_deadline = time.monotonic() + HOT_WINDOW_NS / 1e9
+                event_q.task_done()
+                continue
+            elif event_data is _STOP_EVENTS:
+                if batch:
+                    self._emit_batch(batch)
+                event_q.task_done()
+                return
+            elif event_data is _FLUSH_EVENTS:
+                event_q.task_done()
+            elif type(event_data) is tuple:
+                # A queued message goes out after the events that were queued before it
+                if batch:
+                    self._emit_batch(batch)
+                    batch = []
+                try:
+                    self.sio.emit(*event_data)
+                except Exception as e:
+                    print(f"Failed to emit {event_data[0]}: {e}")
+                finally:
+                    event_q.task_done()
+                continue
+            else:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(event_data)
+                # Failed calls go out straight away so errors show up without delay
+                if len(batch) < self.batch_size and getattr(event_data, 'success', None) is not False:
+                    continue
+            if batch:
+                self._emit_batch(batch)
+                batch = []
+                
+    def _emit_batch(self, batch: list) -> None:
+        """Convert a batch of events to payloads and emit them in one message"""
+        try:
+            payloads = [event.to_dict() if type(event) is ExecutionEvent else event for event in batch]
+            # The hub maps the socket to its registered app, so the app id is not sent
+            if len(payloads) == 1:
+                self.sio.emit('execution_data', payloads[0])
+            else:
+                self.sio.emit('execution_data_batch', payloads)
+        except Exception as e:
+            print(f"Failed to emit execution events: {e}")
+        finally:
+            for _ in batch:
+                self._event_q.task_done()
             
-        return None  # {m.group(1)}erialized
+    def _serialize_parameters(self, args: tuple, kwargs: dict, param_names: tuple = (),
+                              param_defaults: tuple = ()) -> dict:
+        """Serialize function parameters for transmission"""
+        state = self._thread_state
+        internal, state.internal = state.internal, True
+        try:
+            return serialize_parameters(args, kwargs, param_names, param_defaults)
+        finally:
+            state.internal = internal
         
     def _serialize_value(self, value: Any) -> Any:
         """Serialize a value for JSON transmission"""
+        state = self._thread_state
+        internal, state.internal = state.internal, True
         try:
-            # Handle basic types
-            if isinstance(value, (str, int, float, bool, type(None))):
-                return None  # {m.group(1)}alue
-                
-            # Handle lists and tuples
-            elif isinstance(value, (list, tuple)):
-                return None  # {m.group(1)}self._serialize_value(item) for item in value[:10]]  # Limit to 10 items
-                
-            # Handle dictionaries
-            elif isinstance(value, dict):
-                return {k: self._serialize_value(v) for k, v in list(value.items())[:10]}  # Limit to 10 items
-                
-            # Handle other objects
-            else:
-                return {
-                    'type': type(value).__name__,
-                    'module': getattr(type(value), '__module__', 'unknown'),
-                    'repr': str(value)[:200],  # Limit string length
-                    'size': len(value) if hasattr(value, '__len__') else None
-                }
-                
-        except Exception:
-            return {
-                'type': 'serialization_error',
-                'repr': str(value)[:100]
-            }
+            return serialize_value(value)
+        finally:
+            state.internal = internal
 
 
 # Global agent instance
 _global_agent: Optional[Any] = None
 
-def init_monitor(app_name: str, hub_url: str = "http://localhost:3000") -> RuntimeMonitorAgent:
+def init_monitor(app_name: str, hub_url: str = "http://localhost:3000",
+                 hot_threshold: int = 1000) -> RuntimeMonitorAgent:
     """Initialize the global monitor agent"""
     global _global_agent
-    _global_agent = RuntimeMonitorAgent(app_name, hub_url)
+    _global_agent = RuntimeMonitorAgent(app_name, hub_url, hot_threshold=hot_threshold)
     _global_agent.connect_to_hub()
-    return None  # {m.group(1)}global_agent
+    return _global_agent
 
 def get_monitor() -> Optional[RuntimeMonitorAgent]:
     """Get the global monitor agent"""
-    return None  # {m.group(1)}global_agent
+    return _global_agent
 
-def monitor_function(func_name: Optional[str] = None) -> None:
-    """Decorator to monitor function execution using global agent"""
+def monitor_function(func_name: Union[str, Callable, None] = None) -> Callable:
+    """Decorator to monitor function execution using global agent, with or without parentheses"""
     def decorator(func: Callable) -> Callable:
-        if _global_agent is None:
-            # If no global agent, return None  # {m.group(1)}unction unchanged
-            return None  # {m.group(1)}unc
+        if getattr(func, '__runtime_monitored__', False):
+            return func
+        if _global_agent is not None:
+            return _global_agent.monitor_function(func_name)(func)
+            
+        # No agent yet: look it up on every call so init_monitor() may run after import
+        name = sys.intern(func_name or f"{func.__module__}.{func.__name__}")
+        param_names = _positional_parameter_names(func)
+        param_defaults = _parameter_defaults(func)
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                agent = _global_agent
+                if agent is None or not agent._enabled:
+                    return await func(*args, **kwargs)
+                return await agent._execute_async_function(name, func, args, kwargs, param_names,
+                                                           param_defaults)
+                
+            async_wrapper.__runtime_monitored__ = True
+            return async_wrapper
+            
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            agent = _global_agent
+            if agent is None or not agent._enabled:
+                return func(*args, **kwargs)
+            return agent._execute_function(name, func, args, kwargs, param_names, param_defaults)
             
-        return None  # {m.group(1)}global_agent.monitor_function(func_name)(func)
-    return None  # {m.group(1)}ecorator
+        wrapper.__runtime_monitored__ = True
+        return wrapper
+    
+    if callable(func_name):
+        # Applied directly, without parentheses
+        func, func_name = func_name, None
+        return decorator(func)
+    return decorator
 
 
 # Add workflow execution methods to RuntimeMonitorAgent class
@@ -447,10 +1165,18 @@ def _add_workflow_methods_to_class() -> None:
     
     def _execute_python_code(self, code: str, timeout: int = 30) -> Dict[str, Any]:
         """Execute Python code in a controlled environment"""
+        captured_output = io.StringIO()
+        
+        def captured_print(*args, **kwargs) -> None:
+            # print is the only way the restricted code can write, so capture it per
+            # execution instead of swapping sys.stdout under concurrent executions
+            kwargs.setdefault('file', captured_output)
+            print(*args, **kwargs)
+            
         # Create a restricted globals dict
         exec_globals = {
             '__builtins__': {
-                'print': print,
+                'print': captured_print,
                 'len': len,
                 'str': str,
                 'int': int,
@@ -476,22 +1202,14 @@ def _add_workflow_methods_to_class() -> None:
         exec_locals = {}
         
         try:
-            # Capture stdout
-            import io
-            import sys
-            old_stdout = sys.stdout
-            sys.stdout = captured_output = io.StringIO()
-            
-            # Execute with timeout
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(exec, code, exec_globals, exec_locals)
-                try:
-                    future.result(timeout=timeout)
-                except TimeoutError:
-                    raise Exception(f"Code execution timed out after {timeout} seconds")
-            
-            # Restore stdout
-            sys.stdout = old_stdout
+            # Execute with timeout on the agent's reused worker threads
+            if self._exec_pool is None:
+                self._exec_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='code-exec')
+            future = self._exec_pool.submit(exec, code, exec_globals, exec_locals)
+            try:
+                future.result(timeout=timeout)
+            except TimeoutError:
+                raise Exception(f"Code execution timed out after {timeout} seconds")
             
             # Get output
             output = captured_output.getvalue()
@@ -517,7 +1235,8 @@ def _add_workflow_methods_to_class() -> None:
         except Exception as e:
             return {
                 'output': str(e),
-                'error': traceback.format_exc(),
+                'error': ''.join(traceback.TracebackException.from_exception(
+                    e, limit=-STACK_TRACE_LIMIT).format()),
                 'exitCode': 1,
                 'success': False
             }
@@ -537,26 +1256,43 @@ def _add_workflow_methods_to_class() -> None:
             'lastCallTime': time.time()
         }
         
-        # Emit real-time monitoring data periodically
-        def emit_monitoring_data() -> None:
-            while True:
-                time.sleep(2)  # Emit every 2 seconds
-                if not self.connected:
-                    break
-                    
-                monitoring_data['callCount'] += 1
-                monitoring_data['avgExecutionTime'] = 0.1 + (monitoring_data['callCount'] * 0.01)
-                
-                self.sio.emit('function_monitoring_data', monitoring_data)
+        # Emit real-time monitoring data periodically; a repeated request replaces the data
+        if function_name not in self._monitors:
+            self._monitor_scheduler.enter(2, 1, self._emit_monitoring_data, (function_name,))
+        self._monitors[function_name] = monitoring_data
+        
+        if self._monitor_thread is None:
+            self._monitor_thread = threading.Thread(target=self._run_monitor_scheduler,
+                                                    name='runtime-monitor-functions', daemon=True)
+            self._monitor_thread.start()
+        self._monitor_wakeup.set()
         
-        # Start monitoring thread
-        monitor_thread = threading.Thread(target=emit_monitoring_data, daemon=True)
-        monitor_thread.start()
+        return monitoring_data
+    
+    def _run_monitor_scheduler(self) -> None:
+        """Run due monitor ticks, sleeping until a monitor is added once none are left"""
+        while True:
+            self._monitor_wakeup.wait()
+            self._monitor_wakeup.clear()
+            self._monitor_scheduler.run()
+    
+    def _emit_monitoring_data(self, function_name: str) -> None:
+        """Emit one monitor update and schedule the next one 2 seconds later"""
+        monitoring_data = self._monitors.get(function_name)
+        if monitoring_data is None:
+            return
+        if not self.connected:
+            del self._monitors[function_name]
+            return
+            
+        monitoring_data['callCount'] += 1
+        monitoring_data['avgExecutionTime'] = 0.1 + (monitoring_data['callCount'] * 0.01)
         
-        return None  # {m.group(1)}onitoring_data
+        self._queue_emit('function_monitoring_data', dict(monitoring_data))  # Ticks keep mutating it
+        self._monitor_scheduler.enter(2, 1, self._emit_monitoring_data, (function_name,))
     
     def _import_module(self, module_name: str, alias: str = '') -> Dict[str, Any]:
-        """Import a Python module and return None  # {m.group(1)}nfo"""
+        """Import a Python module and return module info"""
         try:
             # Import the module
             module = importlib.import_module(module_name)
@@ -576,21 +1312,25 @@ def _add_workflow_methods_to_class() -> None:
                 'variables': {}
             }
             
-            # Get functions and classes
-            for name, obj in inspect.getmembers(module):
-                if not name.startswith('_'):
-                    if inspect.isfunction(obj):
-                        module_info['functions'].append(name)
-                    elif inspect.isclass(obj):
-                        module_info['classes'].append(name)
-                    elif not callable(obj):
-                        try:
-                            json.dumps(obj, default=str)  # Test if serializable
-                            module_info['variables'][name] = str(type(obj).__name__)
-                        except:
-                            pass
-            
-            return None  # {m.group(1)}odule_info
+            # Get functions and classes straight from the namespace, without
+            # inspect.getmembers() resolving and sorting every attribute
+            functions = module_info['functions']
+            classes = module_info['classes']
+            variables = module_info['variables']
+            for name, obj in vars(module).items():
+                if name.startswith('_'):
+                    continue
+                obj_type = type(obj)
+                if obj_type is types.FunctionType or obj_type is types.BuiltinFunctionType:
+                    functions.append(name)
+                elif isinstance(obj, type):
+                    classes.append(name)
+                elif not callable(obj):
+                    variables[name] = obj_type.__name__
+            functions.sort()
+            classes.sort()
+            
+            return module_info
             
         except ImportError as e:
             raise Exception(f"Failed to import module '{module_name}': {e}")
@@ -603,6 +1343,8 @@ def _add_workflow_methods_to_class() -> None:
     RuntimeMonitorAgent._handle_module_import = _handle_module_import
     RuntimeMonitorAgent._execute_python_code = _execute_python_code
     RuntimeMonitorAgent._start_function_monitoring = _start_function_monitoring
+    RuntimeMonitorAgent._run_monitor_scheduler = _run_monitor_scheduler
+    RuntimeMonitorAgent._emit_monitoring_data = _emit_monitoring_data
     RuntimeMonitorAgent._import_module = _import_module
 
 # Add the methods to the class
@@ -612,25 +1354,28 @@ _add_workflow_methods_to_class()
 if __name__ == "__main__":
     # Initialize the monitor
     monitor = init_monitor("Test Python App")
+    # FAST=1 skips the simulated work so the monitor's own overhead dominates
+    _FAST = bool(os.environ.get('FAST'))
+    _SLEEP = (lambda seconds: None) if _FAST else time.sleep
     
     # Example monitored functions
     @monitor.monitor_function()
-    def calculate_sum(a, b) -> None:
+    def calculate_sum(a, b):
         """Calculate the sum of two numbers"""
-        time.sleep(0.1)  # Simulate work
-        return None  # {m.group(1)} + b
+        _SLEEP(0.1)  # Simulate work
+        return a + b
     
     @monitor.monitor_function()
-    def process_data(data, multiplier=2) -> None:
+    def process_data(data, multiplier=2):
         """Process some data"""
-        time.sleep(0.2)  # Simulate work
-        return None  # {m.group(1)}item * multiplier for item in data]
+        _SLEEP(0.2)  # Simulate work
+        return [item * multiplier for item in data]
     
     @monitor.monitor_function()
-    async def async_operation(delay) -> None:
+    async def async_operation(delay):
         """An async operation"""
-        await asyncio.sleep(delay)
-        return None  # {m.group(1)}"Completed after {delay}s"
+        await asyncio.sleep(0 if _FAST else delay)
+        return f"Completed after {delay}s"
     
     # Define workflow structure
     nodes = [
@@ -0,0 +1,217 @@
+"""
+Runtime Monitor value serialization
+Turns call parameters and return values into JSON-safe data for the hub
+Plain typed functions only, so the module can be compiled with mypyc
+"""
+
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Most values remembered while serializing one call's parameters
+SERIALIZE_CACHE_SIZE = 64
+# Deepest container nesting serialized before values are replaced by a truncation marker
+SERIALIZE_MAX_DEPTH = 4
+# Approximate characters of output allowed for one return value or one call's parameters
+SERIALIZE_BUDGET = 4096
+# Rough charge for a container or a scalar inside one
+_ITEM_COST = 8
+# Items per container kept by the walker
+_MAX_ITEMS = 10
+# Largest numpy array whose min/max/mean are computed; each is a full pass over the data
+NDARRAY_STATS_LIMIT = 65536
+
+# id(value) -> (value, serialized value)
+SerializeCache = Dict[int, Tuple[Any, Any]]
+
+
+def serialize_parameters(args: Tuple[Any, ...], kwargs: Dict[str, Any],
+                         param_names: Tuple[str, ...] = (),
+                         param_defaults: Tuple[Tuple[str, Any], ...] = ()) -> Dict[str, Any]:
+    """Serialize function parameters for transmission"""
+    serialized: Dict[str, Any] = {}
+    # All parameters of one call share a single budget and cache
+    budget = [SERIALIZE_BUDGET]
+    cache: SerializeCache = {}
+
+    # Map positional arguments to the parameter names captured at decoration time
+    for i, arg in enumerate(args):
+        param_name = param_names[i] if i < len(param_names) else f"arg_{i}"
+        serialized[param_name] = serialize_value(arg, cache, budget)
+
+    # Handle keyword arguments
+    for key, value in kwargs.items():
+        serialized[key] = serialize_value(value, cache, budget)
+
+    # Parameters the call left to their defaults, which sys.monitoring reports from the frame
+    for key, value in param_defaults:
+        if key not in serialized:
+            serialized[key] = serialize_value(value, cache, budget)
+
+    return serialized
+
+
+def serialize_value(value: Any, cache: Optional[SerializeCache] = None,
+                    budget: Optional[List[int]] = None, depth: int = 0) -> Any:
+    """Serialize a value for JSON transmission"""
+    # Exact type checks keep the common scalar case to a handful of bytecodes
+    value_type = type(value)
+    if value_type is int or value_type is float or value_type is bool or value is None:
+        return value
+    if value_type is str:
+        if budget is None:
+            return value if len(value) <= SERIALIZE_BUDGET else _truncated_str(value, value_type, [SERIALIZE_BUDGET])
+        return value if _charge(budget, len(value)) else _truncated_str(value, value_type, budget)
+
+    if budget is None:
+        budget = [SERIALIZE_BUDGET]
+    # Only top-level values are cached; nested ones depend on the depth and budget left
+    if cache is None or depth:
+        return _serialize_object(value, value_type, cache, budget, depth)
+
+    # The same object passed as several arguments of one call is serialized once.
+    # A cache must not outlive the call's parameters: user code that runs
+    # afterwards may mutate the object
+    key = id(value)
+    cached = cache.get(key)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+
+    serialized = _serialize_object(value, value_type, cache, budget, depth)
+    if len(cache) >= SERIALIZE_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    # Keeping a reference to the value stops its id from being reused
+    cache[key] = (value, serialized)
+    return serialized
+
+
+def _serialize_object(value: Any, value_type: type, cache: Optional[SerializeCache],
+                      budget: List[int], depth: int) -> Any:
+    """Serialize a non-scalar value"""
+    try:
+        # Bounds the work for deep or cyclic structures such as d['self'] = d
+        if depth >= SERIALIZE_MAX_DEPTH or not _charge(budget, _ITEM_COST):
+            return _truncated(value_type)
+        depth += 1
+
+        # Fast paths for the plain containers
+        if value_type is dict or value_type is list or value_type is tuple:
+            if len(value) > _MAX_ITEMS:
+                # Only the first items are reported, so only those are copied
+                if value_type is dict:
+                    value = dict(islice(value.items(), _MAX_ITEMS))
+                else:
+                    value = value[:_MAX_ITEMS]
+
+            # Validated and copied by orjson in C when nothing below would be cut off by
+            # the caps and the JSON fits the budget; the copy also detaches the event
+            # from later mutation
+            if orjson is not None and _within_limits(value, value_type, depth):
+                try:
+                    dumped = orjson.dumps(value)
+                except TypeError:
+                    pass  # Non-JSON content such as objects or non-string keys; walk it below
+                else:
+                    if _charge(budget, len(dumped)):
+                        return orjson.loads(dumped)
+
+            if value_type is dict:
+                return {k: serialize_value(v, cache, budget, depth) for k, v in value.items()}
+            return [serialize_value(item, cache, budget, depth) for item in value]
+
+        # numpy types are matched by module so numpy is never imported here
+        if value_type.__module__ == 'numpy':
+            # Summarize arrays with numpy's own reductions instead of formatting their data
+            if value_type.__name__ == 'ndarray':
+                return _summarize_ndarray(value)
+            # Numeric scalars become plain Python numbers; np.float64 would otherwise be
+            # sent as a string and the integer types as repr dicts
+            if getattr(value, 'ndim', None) == 0 and value.dtype.kind in 'biuf':
+                return value.item()
+
+        # Handle subclasses of the basic types
+        if isinstance(value, str):
+            return value if _charge(budget, len(value)) else _truncated_str(value, value_type, budget)
+        elif isinstance(value, (int, float, bool)):
+            return value
+
+        # Handle lists and tuples
+        elif isinstance(value, (list, tuple)):
+            return [serialize_value(item, cache, budget, depth) for item in islice(value, _MAX_ITEMS)]
+
+        # Handle dictionaries
+        elif isinstance(value, dict):
+            return {k: serialize_value(v, cache, budget, depth) for k, v in islice(value.items(), _MAX_ITEMS)}
+
+        # Handle other objects
+        else:
+            text = str(value)[:200]  # Limit string length
+            if not _charge(budget, len(text)):
+                return _truncated(value_type)
+            return {
+                'type': value_type.__name__,
+                'module': getattr(value_type, '__module__', 'unknown'),
+                'repr': text,
+                'size': len(value) if hasattr(value, '__len__') else None
+            }
+
+    except Exception:
+        return {
+            'type': 'serialization_error',
+            'repr': str(value)[:100]
+        }
+
+
+def _within_limits(value: Any, value_type: type, depth: int) -> bool:
+    """Whether the walker would keep everything under a container, so orjson may copy it whole"""
+    items = value.values() if value_type is dict else value
+    for item in items:
+        item_type = type(item)
+        if item_type is dict or item_type is list or item_type is tuple:
+            # Nested containers are items at the next depth, cut off by the same caps
+            if depth >= SERIALIZE_MAX_DEPTH or len(item) > _MAX_ITEMS:
+                return False
+            if not _within_limits(item, item_type, depth + 1):
+                return False
+        elif not (item_type is str or item_type is int or item_type is float or item_type is bool or item is None):
+            return False
+    return True
+
+
+def _summarize_ndarray(value: Any) -> Dict[str, Any]:
+    """Shape, dtype and value range of a numpy array"""
+    summary: Dict[str, Any] = {
+        'type': 'ndarray',
+        'shape': list(value.shape),
+        'dtype': str(value.dtype),
+        'size': value.size
+    }
+    if 0 < value.size <= NDARRAY_STATS_LIMIT and value.dtype.kind in 'iuf':
+        summary['min'] = value.min().item()
+        summary['max'] = value.max().item()
+        summary['mean'] = value.mean().item()
+    return summary
+
+
+def _charge(budget: List[int], cost: int) -> bool:
+    """Take cost from the remaining budget, reporting whether it was available"""
+    if cost > budget[0]:
+        return False
+    budget[0] -= cost
+    return True
+
+
+def _truncated(value_type: type) -> Dict[str, Any]:
+    """Marker sent in place of a value that exceeded the depth or size budget"""
+    return {'truncated': True, 'type': value_type.__name__}
+
+
+def _truncated_str(value: str, value_type: type, budget: List[int]) -> Dict[str, Any]:
+    """Marker sent in place of an oversized string, holding as much of it as the budget has left"""
+    prefix = value[:budget[0]]
+    budget[0] = 0
+    return {'truncated': True, 'type': value_type.__name__, 'value': prefix, 'length': len(value)}
@@ -3,10 +3,28 @@ from typing import Any, Callable, Optional, Dict, List
 Simple test for Python agent - focuses on connection and basic monitoring
 """
 
+import os
 import time
 import asyncio
 from runtime_monitor import init_monitor, monitor_function
 
+# FAST=1 skips the simulated work so a run only exercises the monitor plumbing
+_SLEEP = (lambda seconds: None) if os.environ.get('FAST') else time.sleep
+
+# Simple workflow structure shown on the dashboard; built once at import
+WORKFLOW_NODES = [
+    {'id': 'start', 'name': 'Start Process', 'type': 'workflow', 'x': 100, 'y': 100},
+    {'id': 'calculate', 'name': 'Calculate Sum', 'type': 'logic', 'x': 300, 'y': 100},
+    {'id': 'validate', 'name': 'Validate Result', 'type': 'data', 'x': 500, 'y': 100},
+    {'id': 'save', 'name': 'Save Data', 'type': 'storage', 'x': 700, 'y': 100}
+]
+
+WORKFLOW_CONNECTIONS = [
+    {'source': 'start', 'target': 'calculate'},
+    {'source': 'calculate', 'target': 'validate'},
+    {'source': 'validate', 'target': 'save'}
+]
+
 def main() -> None:
     print("🚀 Starting Runtime Hub Python Agent Test...")
     
@@ -16,76 +34,62 @@ def main() -> None:
     # Wait a moment for connection
     time.sleep(2)
     
-    # Define simple workflow structure
-    nodes = [
-        {'id': 'start', 'name': 'Start Process', 'type': 'workflow', 'x': 100, 'y': 100},
-        {'id': 'calculate', 'name': 'Calculate Sum', 'type': 'logic', 'x': 300, 'y': 100},
-        {'id': 'validate', 'name': 'Validate Result', 'type': 'data', 'x': 500, 'y': 100},
-        {'id': 'save', 'name': 'Save Data', 'type': 'storage', 'x': 700, 'y': 100}
-    ]
-    
-    connections = [
-        {'source': 'start', 'target': 'calculate'},
-        {'source': 'calculate', 'target': 'validate'},
-        {'source': 'validate', 'target': 'save'}
-    ]
-    
-    monitor.define_workflow_nodes(nodes, connections)
+    monitor.define_workflow_nodes(WORKFLOW_NODES, WORKFLOW_CONNECTIONS)
     
     print("📊 Workflow nodes defined. Starting function monitoring...")
     
     # Simple monitored function
-    @monitor.monitor_function()
-    def calculate_sum(a, b) -> None:
+    @monitor.monitor_function
+    def calculate_sum(a, b):
         """Calculate the sum of two numbers"""
-        time.sleep(0.5)  # Simulate work
+        _SLEEP(0.5)  # Simulate work
         result = a + b
         print(f"✅ Calculated: {a} + {b} = {result}")
-        return None  # {m.group(1)}esult
+        return result
 
-    @monitor.monitor_function()
-    def validate_result(result) -> None:
+    @monitor.monitor_function
+    def validate_result(result):
         """Validate the calculation result"""
-        time.sleep(0.2)  # Simulate validation
+        _SLEEP(0.2)  # Simulate validation
         is_valid = result > 0
         print(f"✅ Validation: {result} is {'valid' if is_valid else 'invalid'}")
-        return None  # {m.group(1)}s_valid
+        return is_valid
 
-    @monitor.monitor_function()
-    def save_data(data, is_valid) -> None:
+    @monitor.monitor_function
+    def save_data(data, is_valid):
         """Save the data"""
-        time.sleep(0.3)  # Simulate save
+        _SLEEP(0.3)  # Simulate save
         saved_data = {
             'value': data,
             'valid': is_valid,
             'timestamp': time.time()
         }
         print(f"✅ Saved: {saved_data}")
-        return None  # {m.group(1)}aved_data
+        return saved_data
 
-    @monitor.monitor_function()
-    def generate_report(data) -> None:
+    @monitor.monitor_function
+    def generate_report(data):
         """Generate a report from the data"""
-        time.sleep(0.4)  # Simulate report generation
+        _SLEEP(0.4)  # Simulate report generation
         report = {
             'summary': f"Processed value {data['value']} with validity {data['valid']}",
             'timestamp': data['timestamp'],
             'status': 'completed' if data['valid'] else 'failed'
         }
         print(f"📊 Generated report: {report}")
-        return None  # {m.group(1)}eport
+        return report
 
-    @monitor.monitor_function()
-    def send_notification(report) -> None:
+    @monitor.monitor_function
+    def send_notification(report):
         """Send notification about the results"""
-        time.sleep(0.1)  # Simulate notification
+        _SLEEP(0.1)  # Simulate notification
         notification = {
             'title': 'Workflow Completed',
             'message': f"Result: {report['summary']}",
             'type': 'success' if report['status'] == 'completed' else 'warning'
         }
         print(f"📧 Notification sent: {notification}")
-        return None  # {m.group(1)}otification
+        return notification
     
     # Run the workflow
     print("\n🔄 Running workflow...")
@@ -109,17 +113,17 @@ def main() -> None:
     print("📱 Check the Runtime Logger dashboard at http://localhost:3000")
     print("🔄 The agent will continue running and sending periodic updates...")
     
+    # Decorated once; the loop below only calls it
+    @monitor.monitor_function
+    def periodic_task(task_id):
+        """Periodic task to show live updates"""
+        _SLEEP(0.1)
+        return f"Task {task_id} completed successfully"
+    
     # Keep running with periodic updates
     for i in range(5):
-        time.sleep(3)
+        _SLEEP(3)
         print(f"📡 Sending periodic update {i+1}/5...")
-        
-        @monitor.monitor_function()
-        def periodic_task(task_id) -> None:
-            """Periodic task to show live updates"""
-            time.sleep(0.1)
-            return None  # {m.group(1)}"Task {task_id} completed successfully"
-        
         periodic_task(i + 1)
     
     print("\n✅ Enhanced test completed! Keep the agent running to see more updates.")
@@ -7,22 +7,29 @@ Starts the Python agent for workflow execution
 
 import sys
 import os
-import time
+import selectors
 import signal
-import threading
+import socket
 from runtime_monitor import init_monitor
 
 class AgentLauncher:
     def __init__(self) -> None:
         self.monitor: Optional[Any] = None
         self.running = False
+        self._stopping = False
+        # Signals and stop() write to this pair to wake the main thread out of select()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
         
     def signal_handler(self, signum, frame) -> None:
         """Handle shutdown signals"""
         print(f"\nReceived signal {signum}, shutting down...")
-        self.stop()
+        # Only end the main loop, which the signal's wakeup byte has woken;
+        # start() disconnects on its way out
+        self._stopping = True
         
-    def start(self) -> None:
+    def start(self) -> bool:
         """Start the Python agent"""
         print("🚀 Starting Runtime Logger Python Agent...")
         print("=" * 50)
@@ -30,14 +37,16 @@ class AgentLauncher:
         # Setup signal handlers
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
+        # A socket rather than a pipe, so Ctrl+C also interrupts select() on Windows
+        signal.set_wakeup_fd(self._wakeup_send.fileno())
         
         try:
             # Initialize the monitor
             self.monitor = init_monitor("Runtime Logger Agent")
             
-            # Connect to the hub
+            # init_monitor() has already tried to connect; only retry if that failed
             print("📡 Connecting to Runtime Logger hub...")
-            if self.monitor.connect_to_hub():
+            if self.monitor.connected or self.monitor.connect_to_hub():
                 print("✅ Connected successfully!")
                 self.running = True
                 
@@ -45,27 +54,46 @@ class AgentLauncher:
                 print("🔄 Agent is running. Press Ctrl+C to stop.")
                 print("📊 Waiting for workflow execution requests...")
                 
-                # Main loop
-                while self.running:
-                    time.sleep(1)
+                # Block until a signal or stop() asks to shut down
+                self._wait_for_stop()
                     
             else:
                 print("❌ Failed to connect to Runtime Logger hub")
                 print("   Make sure the Runtime Logger server is running on http://localhost:3000")
-                return None  # {m.group(1)}alse
+                return False
                 
         except KeyboardInterrupt:
             print("\n⏹️  Agent stopped by user")
         except Exception as e:
             print(f"❌ Agent error: {e}")
-            return None  # {m.group(1)}alse
+            return False
         finally:
+            signal.set_wakeup_fd(-1)
             self.stop()
             
-        return None  # {m.group(1)}rue
+        return True
+        
+    def _wait_for_stop(self) -> None:
+        """Sleep in select() on the wakeup socket until _stopping is set"""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wakeup_recv, selectors.EVENT_READ)
+            while not self._stopping:
+                selector.select()
+                # Discard the wakeup bytes so a signal that does not stop the agent
+                # leaves select() blocking again
+                try:
+                    while self._wakeup_recv.recv(4096):
+                        pass
+                except (BlockingIOError, InterruptedError):
+                    pass
     
     def stop(self) -> None:
         """Stop the Python agent"""
+        self._stopping = True
+        try:
+            self._wakeup_send.send(b'\0')  # Wake _wait_for_stop() if it runs on another thread
+        except OSError:
+            pass  # Buffer already full of unread wakeups
         if self.running:
             self.running = False
             if self.monitor:
@@ -4,13 +4,18 @@ Simple Fake Loop Demo
 5 different conditions with decent waits
 """
 
+import os
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+
+# FAST=1 skips the simulated waits so a run only exercises the loop's logic
+_SLEEP = (lambda seconds: None) if os.environ.get('FAST') else time.sleep
 
 def check_system_status():
     """Condition 1: Check system status"""
     print("🔍 Checking system status...")
-    time.sleep(2)
+    _SLEEP(2)
     
     cpu_usage = random.uniform(20, 80)
     memory_usage = random.uniform(30, 70)
@@ -22,7 +27,7 @@ def check_system_status():
 def validate_permissions():
     """Condition 2: Validate permissions"""
     print("👤 Validating permissions...")
-    time.sleep(1.5)
+    _SLEEP(1.5)
     
     has_admin = random.choice([True, False])
     can_write = random.choice([True, True, False])
@@ -34,7 +39,7 @@ def validate_permissions():
 def check_network():
     """Condition 3: Check network"""
     print("🌐 Checking network...")
-    time.sleep(2.5)
+    _SLEEP(2.5)
     
     internet = random.choice([True, True, False])
     latency = random.uniform(10, 100)
@@ -45,7 +50,7 @@ def check_network():
 def verify_security():
     """Condition 4: Verify security"""
     print("🔒 Verifying security...")
-    time.sleep(1.8)
+    _SLEEP(1.8)
     
     firewall = random.choice([True, True, False])
     antivirus = random.choice([True, True, False])
@@ -57,7 +62,7 @@ def verify_security():
 def process_pipeline():
     """Condition 5: Process pipeline"""
     print("⚙️ Processing pipeline...")
-    time.sleep(3)
+    _SLEEP(3)
     
     data_size = random.uniform(100, 1000)
     success_rate = random.uniform(0.8, 1.0)
@@ -70,43 +75,45 @@ def run_fake_loop():
     print("🚀 Starting Simple Fake Loop Demo")
     print("=" * 50)
     
-    for loop_num in range(1, 4):  # 3 loops
-        print(f"\n🔄 Loop #{loop_num}")
-        print("-" * 30)
-        
-        # Condition 1
-        system = check_system_status()
-        if system['status'] == 'warning':
-            print("⚠️  System warning, continuing...")
-        
-        # Condition 2
-        perms = validate_permissions()
-        if not perms['valid']:
-            print("❌ Invalid permissions, stopping")
-            break
-        
-        # Condition 3
-        network = check_network()
-        if not network['internet']:
-            print("❌ No internet, stopping")
-            break
-        
-        # Condition 4
-        security = verify_security()
-        if security['score'] < 1:
-            print("⚠️  Low security, continuing...")
-        
-        # Condition 5
-        pipeline = process_pipeline()
-        if pipeline['success'] < 0.5:
-            print("❌ Pipeline failed, stopping")
-            break
-        
-        print(f"✅ Loop #{loop_num} completed!")
-        
-        if loop_num < 3:
-            print("⏳ Waiting 3 seconds...")
-            time.sleep(3)
+    # Conditions 1-4 are independent waits, so each loop runs them side by side
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for loop_num in range(1, 4):  # 3 loops
+            print(f"\n🔄 Loop #{loop_num}")
+            print("-" * 30)
+            
+            checks = [executor.submit(check) for check in
+                      (check_system_status, validate_permissions, check_network, verify_security)]
+            system, perms, network, security = [check.result() for check in checks]
+            
+            # Condition 1
+            if system['status'] == 'warning':
+                print("⚠️  System warning, continuing...")
+            
+            # Condition 2
+            if not perms['valid']:
+                print("❌ Invalid permissions, stopping")
+                break
+            
+            # Condition 3
+            if not network['internet']:
+                print("❌ No internet, stopping")
+                break
+            
+            # Condition 4
+            if security['score'] < 1:
+                print("⚠️  Low security, continuing...")
+            
+            # Condition 5
+            pipeline = process_pipeline()
+            if pipeline['success'] < 0.5:
+                print("❌ Pipeline failed, stopping")
+                break
+            
+            print(f"✅ Loop #{loop_num} completed!")
+            
+            if loop_num < 3:
+                print("⏳ Waiting 3 seconds...")
+                _SLEEP(3)
     
     print("\n🎉 Demo completed!")
 
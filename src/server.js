@@ -188,10 +188,7 @@ io.on('connection', (socket) => {
   });
 
   // Receive execution data
-  socket.on('execution_data', (data) => {
-    const app = activeApplications.get(socket.id);
-    if (!app) return;
-
+  const recordExecutionData = (app, data) => {
     const logId = uuidv4();
     const {
       type,
@@ -221,6 +218,21 @@ io.on('connection', (socket) => {
       returnValue,
       error
     });
+  };
+
+  socket.on('execution_data', (data) => {
+    const app = activeApplications.get(socket.id);
+    if (!app) return;
+
+    recordExecutionData(app, data);
+  });
+
+  // Python agents ship queued events in batches
+  socket.on('execution_data_batch', (batch) => {
+    const app = activeApplications.get(socket.id);
+    if (!app || !Array.isArray(batch)) return;
+
+    batch.forEach(data => recordExecutionData(app, data));
   });
 
   // Receive node graph data
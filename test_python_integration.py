@@ -36,9 +36,11 @@ def test_python_integration():
     @monitor.monitor_function()
     def calculate_fibonacci(n):
         """Calculate Fibonacci number"""
-        if n <= 1:
-            return n
-        return calculate_fibonacci(n-1) + calculate_fibonacci(n-2)
+        # Iterative, so one monitored call instead of one per node of the recursion tree
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
     
     @monitor.monitor_function()
     def process_text(text, operation='upper'):
@@ -55,16 +57,15 @@ def test_python_integration():
     @monitor.monitor_function()
     def generate_primes(limit):
         """Generate prime numbers up to limit"""
-        primes = []
-        for num in range(2, limit + 1):
-            is_prime = True
-            for i in range(2, int(num ** 0.5) + 1):
-                if num % i == 0:
-                    is_prime = False
-                    break
-            if is_prime:
-                primes.append(num)
-        return primes
+        if limit < 2:
+            return []
+        # Sieve of Eratosthenes; each slice assignment strikes out a prime's multiples in C
+        sieve = bytearray([1]) * (limit + 1)
+        sieve[0] = sieve[1] = 0
+        for i in range(2, int(limit ** 0.5) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+        return [num for num, is_prime in enumerate(sieve) if is_prime]
     
     print("\n🔄 Running test functions...")
     
@@ -0,0 +1,65 @@
+"""
+Shared setup for the python-agent repro tests
+"""
+import sys
+import os
+from contextlib import contextmanager
+
+import pytest
+
+# Add the python-agent directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'python-agent'))
+
+
+needs_sys_monitoring = pytest.mark.skipif(not hasattr(sys, 'monitoring'), reason="sys.monitoring needs Python 3.12+")
+# Values of use_sys_monitoring covering both the wrapper and the sys.monitoring paths
+SYS_MONITORING = [False, pytest.param(True, marks=needs_sys_monitoring)]
+
+
+@contextmanager
+def recording_agent(**options):
+    """An online agent whose execution events are collected in a list instead of being sent"""
+    import runtime_monitor
+
+    agent = runtime_monitor.RuntimeMonitorAgent("Test App", **options)
+    sent = []
+    agent._send_execution_event = sent.append
+    agent._set_enabled(True)
+    try:
+        yield agent, sent
+    finally:
+        _release(agent)
+
+
+@contextmanager
+def emitting_agent(**options):
+    """A registered agent with a running event worker; each batch it emits is collected in a list"""
+    import runtime_monitor
+
+    agent = runtime_monitor.RuntimeMonitorAgent("Test App", **options)
+    batches = []
+    agent.sio.emit = lambda channel, data: batches.append([data] if channel == 'execution_data' else data)
+    agent.connected = True
+    agent.app_id = 'test-app'
+    agent._start_event_worker()
+    agent._set_enabled(True)
+    try:
+        yield agent, batches
+    finally:
+        agent.flush()
+        agent.connected = False
+        _release(agent)
+
+
+def _release(agent):
+    """Take an agent offline, stop its event worker and unregister its functions"""
+    import runtime_monitor
+
+    agent._set_enabled(False)
+    agent.disconnect_from_hub()
+    # Module-level test functions must not stay registered with sys.monitoring
+    backend = runtime_monitor._sys_monitoring_backend
+    if backend:
+        for code, entry in list(backend.codes.items()):
+            if entry[0] is agent:
+                backend.discard(code, agent)
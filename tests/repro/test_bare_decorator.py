@@ -0,0 +1,39 @@
+"""
+Repro test for monitor_function applied without parentheses
+@monitor.monitor_function used to treat the function as its name and
+return a decorator, replacing the function.
+"""
+from monitor_helpers import recording_agent
+
+def test_decorator_without_parentheses():
+    """Both decorator forms monitor the function under its default name"""
+    import runtime_monitor
+
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        @agent.monitor_function
+        def double(x):
+            return x * 2
+
+        @agent.monitor_function("custom.name")
+        def square(x):
+            return x * x
+
+        previous_agent = runtime_monitor._global_agent
+        runtime_monitor._global_agent = agent
+        try:
+            @runtime_monitor.monitor_function
+            def triple(x):
+                return x * 3
+
+            assert double(21) == 42
+            assert triple(3) == 9
+            assert square(4) == 16
+        finally:
+            runtime_monitor._global_agent = previous_agent
+
+        assert [event.function_name for event in sent] == [
+            f"{__name__}.double", f"{__name__}.triple", "custom.name"]
+
+if __name__ == "__main__":
+    test_decorator_without_parentheses()
+    print("✅ Bare decorator fix verified")
@@ -0,0 +1,39 @@
+"""
+Repro test for ints outside the 64-bit range in execution events
+orjson refuses to encode them, so a batch holding one failed to encode and
+every event in it was dropped.
+"""
+import json
+
+from socketio import packet
+
+from monitor_helpers import emitting_agent
+
+
+def huge():
+    return 2 ** 70
+
+
+def small():
+    return 1
+
+
+def test_big_int_return_value_is_sent():
+    """A batch with a return value beyond 64 bits is still encoded and sent"""
+    with emitting_agent(use_sys_monitoring=False, flush_interval=60) as (agent, batches):
+        encoded = []
+        agent.sio.emit = lambda *message: encoded.append(
+            agent.sio.packet_class(packet.EVENT, data=list(message)).encode())
+        agent.monitor_function(huge)()
+        agent.monitor_function(small)()
+        agent.flush()
+
+        frame, = encoded
+        channel, events = json.loads(frame[1:])  # After the packet type digit
+        assert channel == 'execution_data_batch'
+        assert [event['returnValue'] for event in events] == [2 ** 70, 1]
+
+
+if __name__ == "__main__":
+    test_big_int_return_value_is_sent()
+    print("✅ Big int payload fix verified")
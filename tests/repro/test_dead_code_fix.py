@@ -9,6 +9,14 @@ import os
 # Add the python-agent directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'python-agent'))
 
+def imported_names(path):
+    """Every name a module imports, from both import and from-import statements"""
+    import ast
+    with open(path, 'r') as f:
+        tree = ast.parse(f.read())
+    return {alias.name for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+            for alias in node.names}
+
 def test_unused_imports():
     """Test that unused imports are removed"""
     
@@ -18,22 +26,13 @@ def test_unused_imports():
         import example_usage
         
         # Check that runtime_monitor doesn't have unused imports
-        import ast
-        with open('python-agent/runtime_monitor.py', 'r') as f:
-            tree = ast.parse(f.read())
-        
-        imports = [node.names[0].name for node in ast.walk(tree) if isinstance(node, ast.Import)]
-        unused_found = any(imp in ['subprocess', 'tempfile'] for imp in imports)
+        unused_found = imported_names('python-agent/runtime_monitor.py') & {'subprocess', 'tempfile'}
         
         if unused_found:
-            pytest.fail("Found unused imports: subprocess, tempfile")
+            pytest.fail(f"Found unused imports: {', '.join(sorted(unused_found))}")
         
         # Check example_usage doesn't have unused imports
-        with open('python-agent/example_usage.py', 'r') as f:
-            tree = ast.parse(f.read())
-        
-        imports = [node.names[0].name for node in ast.walk(tree) if isinstance(node, ast.Import)]
-        unused_found = any(imp in ['get_monitor'] for imp in imports)
+        unused_found = imported_names('python-agent/example_usage.py') & {'get_monitor'}
         
         if unused_found:
             pytest.fail("Found unused import: get_monitor")
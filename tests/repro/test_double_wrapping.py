@@ -0,0 +1,22 @@
+"""
+Repro test for functions wrapped twice by monitor_function
+Re-applying the decorator used to stack a second wrapper, so every call
+was reported twice.
+"""
+from monitor_helpers import recording_agent
+
+def test_decorator_is_idempotent():
+    """A monitored function is returned unchanged when decorated again"""
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        def double(x):
+            return x * 2
+
+        monitored = agent.monitor_function()(double)
+        assert agent.monitor_function()(monitored) is monitored
+
+        assert monitored(21) == 42
+        assert len(sent) == 1
+
+if __name__ == "__main__":
+    test_decorator_is_idempotent()
+    print("✅ Double wrapping fix verified")
@@ -0,0 +1,96 @@
+"""
+Repro test for the batching event worker
+Execution events are queued and emitted by one worker thread, in batches
+that go out once full, once aged, as soon as they hold a failed call, or on
+flush(). The worker exits when the agent disconnects.
+"""
+import time
+
+import pytest
+
+from monitor_helpers import emitting_agent
+
+
+def succeed(x):
+    return x
+
+
+def fail(x):
+    raise ValueError(x)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_full_batches_and_flush():
+    """Events go out in batches of batch_size, and flush() sends the rest"""
+    with emitting_agent(use_sys_monitoring=False, batch_size=3, flush_interval=60) as (agent, batches):
+        monitored = agent.monitor_function(succeed)
+        for i in range(7):
+            monitored(i)
+        agent.flush()
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert [event['parameters']['x'] for batch in batches for event in batch] == list(range(7))
+
+
+def test_failed_call_is_sent_at_once():
+    """A failed call sends its batch without waiting for the interval"""
+    with emitting_agent(use_sys_monitoring=False, flush_interval=60) as (agent, batches):
+        agent.monitor_function(succeed)(1)
+        with pytest.raises(ValueError):
+            agent.monitor_function(fail)(2)
+
+        assert wait_for(lambda: batches)
+        batch, = batches
+        assert [event['success'] for event in batch] == [True, False]
+        assert 'ValueError' in batch[1]['stackTrace']
+
+
+def test_partial_batch_ages_out():
+    """A partial batch is sent once flush_interval has passed"""
+    with emitting_agent(use_sys_monitoring=False, flush_interval=0.05) as (agent, batches):
+        agent.monitor_function(succeed)(1)
+
+        assert wait_for(lambda: batches)
+        assert len(batches[0]) == 1
+
+
+def test_message_follows_earlier_events():
+    """A queued Socket.IO message goes out after the events queued before it"""
+    with emitting_agent(use_sys_monitoring=False, flush_interval=60) as (agent, batches):
+        emitted = []
+        agent.sio.emit = lambda *message: emitted.append(message)
+        agent.monitor_function(succeed)(1)
+        agent.define_workflow_nodes([{'id': 'n'}], [])
+        agent.flush()
+
+        (channel, event), message = emitted
+        assert channel == 'execution_data'
+        assert event['functionName'] == f"{__name__}.succeed"
+        assert message == ('node_data', {'nodes': [{'id': 'n'}], 'connections': []})
+
+
+def test_worker_stops_on_disconnect():
+    """Disconnecting sends what is queued and ends the worker thread"""
+    with emitting_agent(use_sys_monitoring=False, flush_interval=60) as (agent, batches):
+        worker = agent._event_worker
+        agent.monitor_function(succeed)(1)
+        agent.disconnect_from_hub()
+
+        assert agent._event_worker is None
+        assert not worker.is_alive()
+        assert len(batches) == 1
+
+
+if __name__ == "__main__":
+    test_full_batches_and_flush()
+    test_failed_call_is_sent_at_once()
+    test_partial_batch_ages_out()
+    test_message_follows_earlier_events()
+    test_worker_stops_on_disconnect()
+    print("✅ Event batching verified")
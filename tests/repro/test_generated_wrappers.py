@@ -0,0 +1,67 @@
+"""
+Repro test for the wrappers generated with a function's own parameter list
+They must behave like the function they wrap: same defaults, metadata and
+keyword calls, and report the same parameters as the generic wrapper.
+"""
+import inspect
+
+from monitor_helpers import recording_agent
+
+
+def scale(x, factor=2):
+    """Multiply x by factor"""
+    return x * factor
+
+
+def uses_reserved_name(_monitor_agent, y=1):
+    return _monitor_agent + y
+
+
+def test_wrapper_behaves_like_the_function():
+    """Defaults, keyword calls and metadata carry over to the wrapper"""
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        monitored = agent.monitor_function(scale)
+
+        assert monitored is not scale
+        assert monitored.__wrapped__ is scale
+        assert monitored.__name__ == 'scale'
+        assert monitored.__doc__ == "Multiply x by factor"
+        assert inspect.signature(monitored) == inspect.signature(scale)
+
+        assert monitored(3) == 6
+        assert monitored(3, 4) == 12
+        assert monitored(factor=5, x=2) == 10
+        assert [event.parameters for event in sent] == [
+            {'x': 3, 'factor': 2}, {'x': 3, 'factor': 4}, {'x': 2, 'factor': 5}]
+
+
+def test_wrappers_share_a_factory():
+    """Functions with the same parameter names reuse one compiled factory"""
+    import runtime_monitor
+
+    def other(x, factor=3):
+        return x - factor
+
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        agent.monitor_function(scale)
+        factory = runtime_monitor._wrapper_factories[('x', 'factor')]
+        monitored = agent.monitor_function(other)
+
+        assert runtime_monitor._wrapper_factories[('x', 'factor')] is factory
+        assert monitored(5) == 2
+
+
+def test_reserved_parameter_name_falls_back():
+    """A parameter named like the factory's closure variables keeps the generic wrapper"""
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        monitored = agent.monitor_function(uses_reserved_name)
+
+        assert monitored(1) == 2
+        assert sent[0].parameters == {'_monitor_agent': 1, 'y': 1}
+
+
+if __name__ == "__main__":
+    test_wrapper_behaves_like_the_function()
+    test_wrappers_share_a_factory()
+    test_reserved_parameter_name_falls_back()
+    print("✅ Generated wrappers verified")
@@ -0,0 +1,114 @@
+"""
+Repro test for hot-function sampling
+Failed calls outside the sample sent nothing, and the aggregate of a hot
+function that went quiet stayed pending until it was called again.
+"""
+import time
+
+import pytest
+
+from monitor_helpers import SYS_MONITORING, emitting_agent, recording_agent
+
+
+def check(x):
+    if x < 0:
+        raise ValueError("negative")
+    return x
+
+
+def aggregates(batches):
+    return [payload for batch in batches for payload in batch if payload.get('type') == 'call_aggregate']
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_hot_function_is_sampled(use_sys_monitoring):
+    """Past hot_threshold calls a window, only 1 in hot_sample_rate calls is sent"""
+    with recording_agent(use_sys_monitoring=use_sys_monitoring, hot_threshold=2,
+                         hot_sample_rate=3) as (agent, sent):
+        monitored = agent.monitor_function(check)
+        for i in range(10):
+            monitored(i)
+
+        # Every call until the function turns hot, then every third
+        assert [event.return_value for event in sent] == [0, 1, 2, 3, 6, 9]
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_sample_rate_of_one_sends_every_call(use_sys_monitoring):
+    """The smallest sample rate keeps sending every call of a hot function"""
+    with recording_agent(use_sys_monitoring=use_sys_monitoring, hot_threshold=2,
+                         hot_sample_rate=1) as (agent, sent):
+        monitored = agent.monitor_function(check)
+        for i in range(5):
+            monitored(i)
+
+        assert [event.return_value for event in sent] == [0, 1, 2, 3, 4]
+
+
+def test_sample_rate_below_one_is_rejected():
+    """A sample rate of 0 is refused up front instead of failing inside monitored calls"""
+    from runtime_monitor import RuntimeMonitorAgent
+
+    with pytest.raises(ValueError):
+        RuntimeMonitorAgent("Test App", hot_sample_rate=0)
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_unsampled_failure_is_sent(use_sys_monitoring):
+    """A hot function's failed call is reported even when it falls outside the sample"""
+    with recording_agent(use_sys_monitoring=use_sys_monitoring, hot_threshold=2,
+                         hot_sample_rate=1000) as (agent, sent):
+        monitored = agent.monitor_function(check)
+        for _ in range(5):
+            monitored(1)
+        assert len(sent) == 3  # Sampled out once hot
+
+        with pytest.raises(ValueError):
+            monitored(-1)
+
+        failure = sent[-1]
+        assert failure.function_name == f"{__name__}.check"
+        assert failure.success is False
+        assert failure.error == "negative"
+        assert 'ValueError' in failure.to_dict()['stackTrace']
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_flush_sends_pending_aggregate(use_sys_monitoring):
+    """flush() sends the aggregate of a hot function's unfinished window"""
+    with emitting_agent(use_sys_monitoring=use_sys_monitoring, hot_threshold=2,
+                        hot_sample_rate=1000) as (agent, batches):
+        monitored = agent.monitor_function(check)
+        for _ in range(5):
+            monitored(1)
+        agent.flush()
+
+        aggregate, = aggregates(batches)
+        assert aggregate['functionName'] == f"{__name__}.check"
+        assert aggregate['count'] == 5
+
+
+def test_quiet_hot_function_aggregate_is_sent(monkeypatch):
+    """The event worker sends a quiet hot function's aggregate once its window ends"""
+    import runtime_monitor
+    monkeypatch.setattr(runtime_monitor, 'HOT_WINDOW_NS', 50_000_000)
+    with emitting_agent(use_sys_monitoring=False, hot_threshold=2, hot_sample_rate=1000,
+                        flush_interval=0.01) as (agent, batches):
+        monitored = agent.monitor_function(check)
+        for _ in range(5):
+            monitored(1)
+
+        deadline = time.monotonic() + 2
+        while not aggregates(batches) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        aggregate, = aggregates(batches)
+        assert aggregate['count'] == 5
+
+
+if __name__ == "__main__":
+    test_hot_function_is_sampled(False)
+    test_sample_rate_of_one_sends_every_call(False)
+    test_sample_rate_below_one_is_rejected()
+    test_unsampled_failure_is_sent(False)
+    test_flush_sends_pending_aggregate(False)
+    print("✅ Hot sampling fixes verified")
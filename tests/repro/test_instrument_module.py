@@ -0,0 +1,90 @@
+"""
+Repro test for instrument_module and restore_instrumented
+Only the public functions a module defines are patched by default, and
+restoring puts every original back so its calls are no longer reported.
+"""
+import types
+
+import pytest
+
+from monitor_helpers import SYS_MONITORING, recording_agent
+
+SOURCE = '''
+from os.path import join
+
+def area(width, height):
+    return width * height
+
+def perimeter(width, height):
+    return 2 * (width + height)
+
+def _helper():
+    return 'private'
+'''
+
+
+def make_module():
+    module = types.ModuleType('shapes')
+    exec(SOURCE, vars(module))
+    return module
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_public_functions_are_patched(use_sys_monitoring):
+    """Public functions defined by the module are reported; private and imported ones are not"""
+    module = make_module()
+    with recording_agent(use_sys_monitoring=use_sys_monitoring) as (agent, sent):
+        assert agent.instrument_module(module) == ['area', 'perimeter']
+
+        assert module.area(2, 3) == 6
+        assert module.perimeter(2, 3) == 10
+        module._helper()
+        module.join('a', 'b')
+
+        assert [(event.function_name, event.return_value) for event in sent] == [
+            ('shapes.area', 6), ('shapes.perimeter', 10)]
+
+
+def test_include_and_exclude():
+    """include picks attributes by name, exclude leaves some out"""
+    module = make_module()
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        assert agent.instrument_module(module, include=['_helper', 'area']) == ['area', '_helper']
+        agent.restore_instrumented()
+        assert agent.instrument_module(module, exclude=['area']) == ['perimeter']
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_restore_instrumented(use_sys_monitoring):
+    """Restoring puts the original functions back and stops reporting their calls"""
+    module = make_module()
+    originals = (module.area, module.perimeter)
+    with recording_agent(use_sys_monitoring=use_sys_monitoring) as (agent, sent):
+        agent.instrument_module(module)
+        agent.restore_instrumented()
+
+        assert (module.area, module.perimeter) == originals
+        assert module.area(2, 3) == 6
+        assert sent == []
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_restore_keeps_decorated_functions(use_sys_monitoring):
+    """A function decorated explicitly keeps reporting after instrumenting and restoring its module"""
+    module = make_module()
+    with recording_agent(use_sys_monitoring=use_sys_monitoring) as (agent, sent):
+        module.area = agent.monitor_function(module.area)
+        agent.instrument_module(module)
+        agent.restore_instrumented()
+
+        assert module.area(2, 3) == 6
+        assert module.perimeter(2, 3) == 10
+        assert [event.function_name for event in sent] == ['shapes.area']
+
+
+if __name__ == "__main__":
+    test_public_functions_are_patched(False)
+    test_include_and_exclude()
+    test_restore_instrumented(False)
+    test_restore_keeps_decorated_functions(False)
+    print("✅ Module instrumentation verified")
@@ -0,0 +1,33 @@
+"""
+Repro test for the module-level decorator applied before init_monitor()
+The decorator used to return the function unchanged when no agent existed
+yet, so those functions were never monitored.
+"""
+from monitor_helpers import recording_agent
+
+def test_decorator_before_init_monitor():
+    """Functions decorated before the global agent exists report once it does"""
+    import runtime_monitor
+
+    previous_agent = runtime_monitor._global_agent
+    runtime_monitor._global_agent = None
+    try:
+        @runtime_monitor.monitor_function()
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+
+        with recording_agent() as (agent, sent):
+            runtime_monitor._global_agent = agent
+
+            assert add(2, 3) == 5
+            assert len(sent) == 1
+            assert sent[0].function_name.endswith('add')
+            assert sent[0].parameters == {'a': 2, 'b': 3}
+    finally:
+        runtime_monitor._global_agent = previous_agent
+
+if __name__ == "__main__":
+    test_decorator_before_init_monitor()
+    print("✅ Late init_monitor fix verified")
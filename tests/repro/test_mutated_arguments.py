@@ -0,0 +1,60 @@
+"""
+Repro test for values mutated by a monitored call
+Serialized parameters were cached for the whole monitored call chain, so a
+return value that was the same, since mutated, object was reported as it
+looked when the call started.
+"""
+import pytest
+
+from monitor_helpers import SYS_MONITORING, recording_agent
+
+
+def append_one(lst):
+    lst.append(1)
+    return lst
+
+
+def fill(d):
+    d['filled'] = True
+
+
+def build(d):
+    monitored_fill(d)
+    return d
+
+
+monitored_fill = fill
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_return_value_after_mutation(use_sys_monitoring):
+    """A mutated argument returned by the same call is reported as it was returned"""
+    with recording_agent(use_sys_monitoring=use_sys_monitoring) as (agent, sent):
+        monitored = agent.monitor_function(append_one)
+
+        assert monitored([0]) == [0, 1]
+        assert sent[0].parameters == {'lst': [0]}
+        assert sent[0].return_value == [0, 1]
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+def test_caller_return_value_after_callee_mutation(use_sys_monitoring):
+    """A caller's return value reflects what a monitored callee did to it"""
+    global monitored_fill
+    with recording_agent(use_sys_monitoring=use_sys_monitoring) as (agent, sent):
+        monitored_fill = agent.monitor_function(fill)
+        try:
+            assert agent.monitor_function(build)({}) == {'filled': True}
+        finally:
+            monitored_fill = fill
+
+        fill_event, build_event = sent
+        assert fill_event.parameters == {'d': {}}
+        assert build_event.parameters == {'d': {}}
+        assert build_event.return_value == {'filled': True}
+
+
+if __name__ == "__main__":
+    test_return_value_after_mutation(False)
+    test_caller_return_value_after_callee_mutation(False)
+    print("✅ Mutated argument fix verified")
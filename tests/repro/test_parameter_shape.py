@@ -0,0 +1,44 @@
+"""
+Repro test for the parameters reported by the two monitoring paths
+sys.monitoring reported extra positionals as one *args list and parameters
+left to their defaults, while the generic wrapper reported extras as
+arg_<i> and left defaults out.
+"""
+import pytest
+
+from monitor_helpers import SYS_MONITORING, recording_agent
+
+
+def gather(a, *rest, k=1, **options):
+    return a
+
+
+def scale(x, factor=2):
+    return x * factor
+
+
+def tag(value, *, label='x'):
+    return value
+
+
+@pytest.mark.parametrize('use_sys_monitoring', SYS_MONITORING)
+@pytest.mark.parametrize('func, args, kwargs, expected', [
+    (gather, (1, 2, 3), {'flag': True}, {'a': 1, 'arg_1': 2, 'arg_2': 3, 'k': 1, 'flag': True}),
+    (gather, (1,), {'k': 5}, {'a': 1, 'k': 5}),
+    (scale, (3,), {}, {'x': 3, 'factor': 2}),
+    (scale, (), {'x': 3, 'factor': 4}, {'x': 3, 'factor': 4}),
+    (tag, (1,), {}, {'value': 1, 'label': 'x'}),
+])
+def test_parameter_shape(use_sys_monitoring, func, args, kwargs, expected):
+    """Both paths report extra positionals as arg_<i> and include defaults"""
+    with recording_agent(use_sys_monitoring=use_sys_monitoring) as (agent, sent):
+        agent.monitor_function(func)(*args, **kwargs)
+
+        assert sent[0].parameters == expected
+
+
+if __name__ == "__main__":
+    test_parameter_shape(False, gather, (1, 2, 3), {'flag': True},
+                         {'a': 1, 'arg_1': 2, 'arg_2': 3, 'k': 1, 'flag': True})
+    test_parameter_shape(False, tag, (1,), {}, {'value': 1, 'label': 'x'})
+    print("✅ Parameter shape fix verified")
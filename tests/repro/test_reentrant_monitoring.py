@@ -0,0 +1,29 @@
+"""
+Repro test for monitored functions called by the agent itself
+A monitored __str__ ran again, and was reported, every time the agent
+serialized an instance of its class.
+"""
+from monitor_helpers import recording_agent
+
+def test_agent_serialization_is_not_monitored():
+    """Only the user's own call to a monitored __str__ is reported"""
+    with recording_agent(use_sys_monitoring=False) as (agent, sent):
+        class Thing:
+            def __str__(self):
+                return "thing"
+        Thing.__str__ = agent.monitor_function()(Thing.__str__)
+
+        @agent.monitor_function()
+        def use(thing):
+            return 1
+
+        assert use(Thing()) == 1
+        assert sent[0].parameters['thing']['repr'] == "thing"
+        assert len(sent) == 1
+
+        assert str(Thing()) == "thing"
+        assert len(sent) == 2
+
+if __name__ == "__main__":
+    test_agent_serialization_is_not_monitored()
+    print("✅ Re-entrant monitoring fix verified")
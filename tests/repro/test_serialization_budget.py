@@ -0,0 +1,65 @@
+"""
+Repro test for unbounded serialization of nested and cyclic values
+Deep structures used to recurse until RecursionError; they are now cut off
+by the depth cap and the per-value byte budget.
+"""
+import sys
+import os
+
+# Add the python-agent directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'python-agent'))
+
+from serialization import SERIALIZE_MAX_DEPTH, serialize_parameters, serialize_value
+
+
+def nested(depth, leaf):
+    """A chain of single-key dicts depth levels deep"""
+    value = leaf
+    for _ in range(depth):
+        value = {'next': value}
+    return value
+
+
+def test_cyclic_dict_is_truncated():
+    """A self-referencing dict stops at the depth cap"""
+    cyclic = {}
+    cyclic['self'] = cyclic
+
+    serialized = serialize_value(cyclic)
+    for _ in range(SERIALIZE_MAX_DEPTH):
+        serialized = serialized['self']
+    assert serialized == {'truncated': True, 'type': 'dict'}
+
+
+def test_large_values_share_the_budget():
+    """Oversized strings keep a prefix as long as the budget left, which they use up"""
+    assert serialize_value('x' * 10000) == {'truncated': True, 'type': 'str', 'value': 'x' * 4096, 'length': 10000}
+
+    params = serialize_parameters(('a' * 3000, 'b' * 3000, 'c'), {}, ('first', 'second', 'third'))
+    assert params['first'] == 'a' * 3000
+    assert params['second'] == {'truncated': True, 'type': 'str', 'value': 'b' * 1096, 'length': 3000}
+    assert params['third'] == {'truncated': True, 'type': 'str', 'value': '', 'length': 1}
+
+
+def test_item_cap_applies_below_the_top_level():
+    """Containers nested below the top level keep only their first items"""
+    serialized = serialize_value({'a': {'b': list(range(50))}})
+    assert serialized == {'a': {'b': list(range(10))}}
+
+
+def test_depth_cap_ignores_leaf_types():
+    """Plain data is cut off at the same depth as data with objects in it"""
+    plain = serialize_value(nested(SERIALIZE_MAX_DEPTH + 2, 1))
+    mixed = serialize_value(nested(SERIALIZE_MAX_DEPTH + 2, object()))
+    assert plain == mixed
+    for _ in range(SERIALIZE_MAX_DEPTH):
+        plain = plain['next']
+    assert plain == {'truncated': True, 'type': 'dict'}
+
+
+if __name__ == "__main__":
+    test_cyclic_dict_is_truncated()
+    test_large_values_share_the_budget()
+    test_item_cap_applies_below_the_top_level()
+    test_depth_cap_ignores_leaf_types()
+    print("✅ Serialization budget verified")
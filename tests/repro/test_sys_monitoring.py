@@ -0,0 +1,107 @@
+"""
+Repro test for the sys.monitoring backend
+It claimed the profiler tool id, reported undecorated functions sharing a
+decorated function's code object, could not be undone and kept its callbacks
+running while the agent was offline.
+"""
+import cProfile
+import sys
+
+from monitor_helpers import needs_sys_monitoring, recording_agent
+
+pytestmark = needs_sys_monitoring
+
+
+def square(x):
+    return x * x
+
+
+def make_adder(n):
+    def add(x):
+        return x + n
+    return add
+
+
+def go_offline(agent):
+    agent._set_enabled(False)
+    return 'offline'
+
+
+def local_events(code):
+    import runtime_monitor
+    backend = runtime_monitor._sys_monitoring_backend
+    return sys.monitoring.get_local_events(backend.tool_id, code)
+
+
+def test_profiler_still_usable():
+    """cProfile can run while the agent monitors functions"""
+    with recording_agent(use_sys_monitoring=True) as (agent, sent):
+        monitored = agent.monitor_function(square)
+        assert monitored is square
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            assert square(3) == 9
+        finally:
+            profiler.disable()
+
+        assert [event.return_value for event in sent] == [9]
+
+
+def test_shared_code_not_reported():
+    """Only the decorated closure is reported, not others made by the same factory"""
+    with recording_agent(use_sys_monitoring=True) as (agent, sent):
+        add_one, add_two = make_adder(1), make_adder(2)
+        monitored = agent.monitor_function(add_one)
+
+        assert monitored(1) == 2
+        assert add_two(1) == 3
+        assert [event.return_value for event in sent] == [2]
+
+
+def test_unmonitor_function():
+    """A function registered with sys.monitoring can be unregistered"""
+    with recording_agent(use_sys_monitoring=True) as (agent, sent):
+        agent.monitor_function(square)
+        square(2)
+        assert agent.unmonitor_function(square) is square
+        square(3)
+
+        assert [event.return_value for event in sent] == [4]
+        assert local_events(square.__code__) == 0
+
+
+def test_no_events_while_offline():
+    """Monitored functions run without callbacks while the agent is offline"""
+    with recording_agent(use_sys_monitoring=True) as (agent, sent):
+        agent.monitor_function(square)
+        agent._set_enabled(False)
+        assert local_events(square.__code__) == 0
+        assert square(2) == 4
+
+        agent._set_enabled(True)
+        assert local_events(square.__code__) != 0
+        assert square(3) == 9
+        assert [event.return_value for event in sent] == [9]
+
+
+def test_offline_during_call():
+    """A call whose exit went unseen doesn't stop later calls being reported"""
+    with recording_agent(use_sys_monitoring=True) as (agent, sent):
+        agent.monitor_function(go_offline)
+        agent.monitor_function(square)
+
+        assert go_offline(agent) == 'offline'
+        agent._set_enabled(True)
+        assert square(3) == 9
+        assert [event.return_value for event in sent] == [9]
+
+
+if __name__ == "__main__":
+    test_profiler_still_usable()
+    test_shared_code_not_reported()
+    test_unmonitor_function()
+    test_no_events_while_offline()
+    test_offline_during_call()
+    print("✅ sys.monitoring backend fixes verified")
@@ -42,8 +42,8 @@ def test_web_entrypoint():
     try:
         result = subprocess.run(
             ["npx", "tsc", "--noEmit", "--skipLibCheck"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,  # tsc reports diagnostics on stdout
+            stderr=subprocess.DEVNULL,
             timeout=30
         )
         
@@ -51,7 +51,8 @@ def test_web_entrypoint():
             print("✅ TypeScript compilation successful")
         else:
             print("⚠️ TypeScript compilation issues (expected during development)")
-            print(f"   Errors: {len(result.stderr.splitlines())} lines")
+            error_lines = result.stdout.count(b'\n')
+            print(f"   Errors: {error_lines} lines")
     
     except (subprocess.TimeoutExpired, FileNotFoundError):
         print("⚠️ TypeScript compiler not available or timed out")